@@ -0,0 +1,37 @@
+"""
+Measure the latency of Toolkit.get_element for names that resolve (hits)
+and names that don't (misses), bypassing the method's result cache.
+
+    python benchmarks/get_element.py --snapshot biolink.bmt
+"""
+import argparse
+import inspect
+import timeit
+
+from bmt import Toolkit
+
+HITS = ["gene", "biolink:Gene", "Gene", "biolink:related_to", "related_to", "molecular function", "RNA Product"]
+MISSES = ["biolink:NotAClass", "not a class", "NotAClass", "not_a_slot", "UBERON:0001981"]
+
+
+def report(label, toolkit, names, number):
+    get_element = inspect.unwrap(Toolkit.get_element)
+    seconds = timeit.timeit(lambda: [get_element(toolkit, name) for name in names], number=number)
+    print(f"{label:<6} {seconds / (number * len(names)) * 1e6:8.2f} us per lookup")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--snapshot", help="load the model from a snapshot instead of from its sources")
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    toolkit = Toolkit.from_snapshot(args.snapshot) if args.snapshot else Toolkit()
+    # build the lookup indexes before timing
+    toolkit.get_element("gene")
+    report("hit", toolkit, HITS, args.number)
+    report("miss", toolkit, MISSES, args.number)
+
+
+if __name__ == "__main__":
+    main()
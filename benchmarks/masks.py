@@ -0,0 +1,65 @@
+"""
+Compare testing a synthetic column of category names row by row with
+Toolkit.is_category against testing it at once with Toolkit.is_category_mask.
+
+The column mixes the CURIEs, names and CamelCase spellings of all classes
+with names that don't resolve. The row by row loop is timed on a sample
+of the column and extrapolated to the whole column.
+
+    python benchmarks/masks.py --rows 10000000 --snapshot biolink.bmt
+"""
+import argparse
+import random
+import time
+
+from bmt import Toolkit
+from bmt.utils import sentencecase_to_camelcase
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def make_column(toolkit, rows, seed):
+    classes = toolkit.get_all_classes()
+    values = classes + toolkit.get_all_classes(formatted=True) + [sentencecase_to_camelcase(c) for c in classes]
+    values += [f"biolink:NotAClass{i}" for i in range(100)]
+    rng = random.Random(seed)
+    return [rng.choice(values) for _ in range(rows)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--snapshot", help="load the model from a snapshot instead of from its sources")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--sample", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    toolkit = Toolkit.from_snapshot(args.snapshot) if args.snapshot else Toolkit()
+    column = make_column(toolkit, args.rows, args.seed)
+    # build the lookup indexes before timing
+    toolkit.is_category_mask(column[:10])
+
+    sample = column[:args.sample]
+    start = time.perf_counter()
+    [toolkit.is_category(name) for name in sample]
+    seconds = (time.perf_counter() - start) * len(column) / len(sample)
+    print(f"{'is_category per row':<32} {seconds:8.2f} s (extrapolated from {len(sample)} rows)")
+
+    start = time.perf_counter()
+    mask = toolkit.is_category_mask(column)
+    print(f"{'is_category_mask on a list':<32} {time.perf_counter() - start:8.2f} s")
+
+    if numpy is not None:
+        array = numpy.array(column)
+        start = time.perf_counter()
+        mask = toolkit.is_category_mask(array)
+        print(f"{'is_category_mask on an array':<32} {time.perf_counter() - start:8.2f} s")
+    count = int(numpy.count_nonzero(mask)) if numpy is not None else sum(mask)
+    print(f"{count} of {len(column)} rows are categories")
+
+
+if __name__ == "__main__":
+    main()
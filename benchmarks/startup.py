@@ -0,0 +1,64 @@
+"""
+Compare Toolkit startup time when loading the model from its sources
+against loading it from a compiled snapshot.
+
+Each measurement runs in a fresh interpreter so that no in-process caches
+are shared between runs. Import time of the bmt package is excluded.
+
+    python benchmarks/startup.py --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+CHILD = """
+import sys, time
+from bmt import Toolkit
+start = time.perf_counter()
+{construct}
+t.get_ancestors("gene")
+print(time.perf_counter() - start)
+"""
+
+
+def time_child(construct: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD.format(construct=construct)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--snapshot", help="existing snapshot to use instead of compiling one")
+    args = parser.parse_args()
+
+    snapshot = args.snapshot
+    if snapshot is None:
+        from bmt import Toolkit
+
+        snapshot = os.path.join(tempfile.mkdtemp(), "biolink.bmt")
+        Toolkit().compile(snapshot)
+    print(f"snapshot: {snapshot} ({os.path.getsize(snapshot) / 1e6:.1f} MB)")
+
+    paths = {
+        "Toolkit()": "t = Toolkit()",
+        "Toolkit.from_snapshot()": f"t = Toolkit.from_snapshot({snapshot!r})",
+    }
+    for label, construct in paths.items():
+        timings = [time_child(construct) for _ in range(args.runs)]
+        print(
+            f"{label:<26} median {statistics.median(timings) * 1000:8.1f} ms"
+            f"  min {min(timings) * 1000:8.1f} ms  ({args.runs} runs)"
+        )
+
+
+if __name__ == "__main__":
+    main()
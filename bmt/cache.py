@@ -0,0 +1,362 @@
+import inspect
+import threading
+from collections import OrderedDict, namedtuple
+from functools import wraps
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple
+
+NegativeCacheInfo = namedtuple("NegativeCacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+class NegativeCache(object):
+    """
+    A bounded set of keys that are known not to resolve to anything,
+    evicting the least recently seen key when it is full.
+
+    Parameters
+    ----------
+    maxsize: int
+        The maximum number of keys to remember
+
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._keys = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            if key in self._keys:
+                self._keys.move_to_end(key)
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def add(self, key: Hashable) -> None:
+        """
+        Remember that a key does not resolve.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key
+
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._keys[key] = None
+            self._keys.move_to_end(key)
+            if len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Forget all keys and reset the counters.
+        """
+        with self._lock:
+            self._keys.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> NegativeCacheInfo:
+        """
+        Get the counters of the cache.
+
+        Returns
+        -------
+        NegativeCacheInfo
+            The number of hits, misses and evictions, and the maximum and current size
+
+        """
+        with self._lock:
+            return NegativeCacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._keys))
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize", "policy"])
+
+# How many results a method cache holds, and which result it evicts when it is full.
+# A maxsize of None means the cache is unbounded, and 0 that results are not cached.
+CacheSpec = namedtuple("CacheSpec", ["maxsize", "policy"])
+
+CACHE_POLICIES = ("lru", "fifo")
+
+
+class _FrozenList(tuple):
+    pass
+
+
+class _FrozenSet(frozenset):
+    pass
+
+
+class _FrozenDict(tuple):
+    pass
+
+
+_FROZEN_TYPES = (_FrozenList, _FrozenSet, _FrozenDict)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Make an immutable copy of a list, set or dict result, so that callers
+    can't modify a cached result. Other values are returned as they are.
+    """
+    if isinstance(value, list):
+        return _FrozenList(value)
+    if isinstance(value, set):
+        return _FrozenSet(value)
+    if isinstance(value, dict):
+        return _FrozenDict(value.items())
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Make a new mutable copy of a result frozen by ``freeze``.
+    """
+    if isinstance(value, _FrozenList):
+        return list(value)
+    if isinstance(value, _FrozenSet):
+        return set(value)
+    if isinstance(value, _FrozenDict):
+        return dict(value)
+    return value
+
+
+class MethodCache(object):
+    """
+    A thread-safe cache of the results of one method of one object.
+
+    Parameters
+    ----------
+    maxsize: Optional[int]
+        The maximum number of results to keep, None for no limit, or 0 to not cache results
+    policy: str
+        ``lru`` to evict the least recently used result when the cache is full,
+        or ``fifo`` to evict the oldest one
+
+    """
+
+    def __init__(self, maxsize: Optional[int], policy: str = "lru") -> None:
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"unknown cache policy {policy!r}, expected one of {CACHE_POLICIES}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a result, counting a hit or a miss.
+
+        Parameters
+        ----------
+        key: Hashable
+            The arguments of the call
+        default: Any
+            The value to return if the result is not cached
+
+        Returns
+        -------
+        Any
+            The cached result, or default
+
+        """
+        with self._lock:
+            try:
+                value = self._results[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if self.policy == "lru":
+                self._results.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a result, evicting another one if the cache is full.
+
+        Parameters
+        ----------
+        key: Hashable
+            The arguments of the call
+        value: Any
+            The result
+
+        """
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._results[key] = value
+            if self.maxsize is not None and len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """
+        Get the cached results, from the oldest or least recently used one.
+
+        Returns
+        -------
+        List[Tuple[Hashable, Any]]
+            The arguments and result of each cached call
+
+        """
+        with self._lock:
+            return list(self._results.items())
+
+    def update(self, items: Iterable[Tuple[Hashable, Any]]) -> None:
+        """
+        Cache results returned by ``items``, without counting hits or misses.
+
+        Parameters
+        ----------
+        items: Iterable[Tuple[Hashable, Any]]
+            The arguments and result of each call
+
+        """
+        for key, value in items:
+            self.put(key, value)
+
+    def clear(self) -> None:
+        """
+        Remove all results and reset the counters.
+        """
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Get the counters of the cache.
+
+        Returns
+        -------
+        CacheInfo
+            The number of hits, misses and evictions, the maximum and current size, and the policy
+
+        """
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self._results), self.policy
+            )
+
+
+_MISSING = object()
+
+
+def _bind_function(method: Callable) -> Callable:
+    # Bind calls to the value of every parameter, in order, so that passing an
+    # argument by keyword, positionally or leaving it to its default shares one
+    # result. Calls that can't be bound this way are bound to None.
+    parameters = list(inspect.signature(method).parameters.values())[1:]
+    if any(p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD, p.KEYWORD_ONLY) for p in parameters):
+        return lambda args, kwargs: None if kwargs else args
+    names = tuple(p.name for p in parameters)
+    defaults = tuple(p.default for p in parameters)
+    count = len(parameters)
+
+    def bind(args, kwargs):
+        given = len(args)
+        if given == count and not kwargs:
+            return args
+        if given > count or any(name not in names[given:] for name in kwargs):
+            return None
+        values = args + tuple(kwargs.get(name, default) for name, default in zip(names[given:], defaults[given:]))
+        if inspect.Parameter.empty in values:
+            return None
+        return values
+
+    return bind
+
+
+def cached(
+        maxsize: Optional[int] = 1024,
+        policy: str = "lru",
+        names: Tuple[str, ...] = (),
+        formatted: Optional[str] = None,
+) -> Callable:
+    """
+    Cache the results of a method in a ``MethodCache`` of the object it is
+    called on, instead of in one cache shared by all objects.
+
+    The object provides its caches through a ``_method_cache(name, default)``
+    method, which can override the size and policy given here. Results are
+    keyed by the value of every parameter, defaults included. Lists, sets
+    and dicts are cached as immutable copies, and every call gets a new copy.
+
+    Parameters
+    ----------
+    maxsize: Optional[int]
+        The default maximum number of results to keep, or None for no limit
+    policy: str
+        The default eviction policy, ``lru`` or ``fifo``
+    names: Tuple[str, ...]
+        The parameters that take names. The object's ``_canonical_name(name)``
+        maps each spelling of a name to one name (or None to leave it as it is),
+        which the method is called and its result is keyed with.
+    formatted: Optional[str]
+        The boolean parameter that formats the result. Results are computed
+        and cached unformatted, and formatted by the object's ``_format_result(result)``.
+
+    Returns
+    -------
+    Callable
+        The decorator
+
+    """
+    default = CacheSpec(maxsize, policy)
+
+    def decorator(method: Callable) -> Callable:
+        name = method.__name__
+        bind = _bind_function(method)
+        parameters = [p.name for p in inspect.signature(method).parameters.values()][1:]
+        name_positions = tuple(parameters.index(parameter) for parameter in names)
+        format_position = parameters.index(formatted) if formatted else None
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = self._method_cache(name, default)
+            values = bind(args, kwargs)
+            if values is None:
+                # the call fails, so don't let it hit another call's result
+                key = (args, tuple(sorted(kwargs.items())))
+                value = cache.get(key, _MISSING)
+                if value is _MISSING:
+                    value = freeze(method(self, *args, **kwargs))
+                    cache.put(key, value)
+                return thaw(value)
+            project = False
+            if name_positions or format_position is not None:
+                values = list(values)
+                for position in name_positions:
+                    canonical = self._canonical_name(values[position])
+                    if canonical is not None:
+                        values[position] = canonical
+                if format_position is not None:
+                    project = values[format_position]
+                    values[format_position] = False
+                values = tuple(values)
+            value = cache.get(values, _MISSING)
+            if value is _MISSING:
+                value = freeze(method(self, *values))
+                cache.put(values, value)
+            if project:
+                return self._format_result(value)
+            if type(value) not in _FROZEN_TYPES:
+                return value
+            return thaw(value)
+
+        wrapper.cache_spec = default
+        return wrapper
+
+    return decorator
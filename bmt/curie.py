@@ -0,0 +1,143 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Key of the trie node that holds the prefix of the namespace ending at that node
+_PREFIX = ""
+
+
+class CurieCodec(object):
+    """
+    Expands CURIEs to IRIs and contracts IRIs to CURIEs for a fixed set of prefixes.
+
+    Expansion is a lookup in a dictionary of prefixes. Contraction walks a trie
+    of the namespaces and uses the longest namespace that the IRI starts with.
+    Identifiers that can't be expanded or contracted are returned unchanged.
+
+    Parameters
+    ----------
+    prefixes: Dict[str, str]
+        The namespace of each prefix. Where several prefixes share a namespace,
+        the first one is used for contraction.
+
+    """
+
+    def __init__(self, prefixes: Dict[str, str]) -> None:
+        self.prefixes = {prefix: str(namespace) for prefix, namespace in prefixes.items()}
+        self._trie = {}
+        for prefix, namespace in self.prefixes.items():
+            if not namespace:
+                continue
+            node = self._trie
+            for character in namespace:
+                node = node.setdefault(character, {})
+            node.setdefault(_PREFIX, prefix)
+
+    @staticmethod
+    def split(curie: str) -> Optional[Tuple[str, str]]:
+        """
+        Split a CURIE into its prefix and local identifier.
+
+        Parameters
+        ----------
+        curie: str
+            The CURIE
+
+        Returns
+        -------
+        Optional[Tuple[str, str]]
+            The prefix and the local identifier, or None if the string is not a CURIE
+
+        """
+        prefix, separator, reference = curie.partition(":")
+        if not separator:
+            return None
+        return prefix, reference
+
+    def expand(self, curie: str) -> str:
+        """
+        Expand a CURIE to an IRI.
+
+        Parameters
+        ----------
+        curie: str
+            The CURIE
+
+        Returns
+        -------
+        str
+            The IRI, or the given string if its prefix is unknown
+
+        """
+        prefix, separator, reference = curie.partition(":")
+        namespace = self.prefixes.get(prefix) if separator else None
+        if namespace is None:
+            return curie
+        return namespace + reference
+
+    def contract(self, iri: str) -> str:
+        """
+        Contract an IRI to a CURIE, using the longest known namespace.
+
+        Parameters
+        ----------
+        iri: str
+            The IRI
+
+        Returns
+        -------
+        str
+            The CURIE, or the given string if it is not in a known namespace
+
+        """
+        node = self._trie
+        match = None
+        for position, character in enumerate(iri):
+            node = node.get(character)
+            if node is None:
+                break
+            if _PREFIX in node:
+                match = (node[_PREFIX], position + 1)
+        if match is None:
+            return iri
+        prefix, length = match
+        return f"{prefix}:{iri[length:]}"
+
+    def expand_many(self, curies: Iterable[str]) -> List[str]:
+        """
+        Expand CURIEs to IRIs.
+
+        Parameters
+        ----------
+        curies: Iterable[str]
+            The CURIEs
+
+        Returns
+        -------
+        List[str]
+            The IRIs, in the same order
+
+        """
+        prefixes = self.prefixes
+        iris = []
+        for curie in curies:
+            prefix, separator, reference = curie.partition(":")
+            namespace = prefixes.get(prefix) if separator else None
+            iris.append(curie if namespace is None else namespace + reference)
+        return iris
+
+    def contract_many(self, iris: Iterable[str]) -> List[str]:
+        """
+        Contract IRIs to CURIEs.
+
+        Parameters
+        ----------
+        iris: Iterable[str]
+            The IRIs
+
+        Returns
+        -------
+        List[str]
+            The CURIEs, in the same order
+
+        """
+        contract = self.contract
+        return [contract(iri) for iri in iris]
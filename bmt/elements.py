@@ -0,0 +1,143 @@
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Kinds of elements, in the order their codes are assigned
+ELEMENT_KINDS = ("class", "slot", "type", "enum", "subset")
+
+# Bits of the element flags
+MIXIN = 1
+ABSTRACT = 2
+MULTIVALUED = 4
+CANONICAL = 8
+SYMMETRIC = 16
+
+ELEMENT_FLAGS = {
+    "mixin": MIXIN,
+    "abstract": ABSTRACT,
+    "multivalued": MULTIVALUED,
+    "canonical": CANONICAL,
+    "symmetric": SYMMETRIC,
+}
+
+
+class ElementTable(object):
+    """
+    The elements of a model as parallel arrays indexed by integer element id.
+
+    Ids are assigned in the order the elements are given, from 0. Each id
+    has a name, a CURIE, a kind (a position in ``ELEMENT_KINDS``), a bitset
+    of flags (see ``ELEMENT_FLAGS``) and the id of its ``is_a`` parent, or -1.
+    Names and CURIEs are interned, so equal strings share one object.
+
+    Parameters
+    ----------
+    elements: Iterable[Tuple[str, str, str, int, Optional[str]]]
+        The name, CURIE, kind, flags and parent name of each element.
+        Elements with a name that was already given are skipped.
+
+    """
+
+    def __init__(self, elements: Iterable[Tuple[str, str, str, int, Optional[str]]]) -> None:
+        self.names: List[str] = []
+        self.curies: List[str] = []
+        self.kinds = array("b")
+        self.flags = array("B")
+        self.parents = array("i")
+        self.ids: Dict[str, int] = {}
+        parent_names = []
+        for name, curie, kind, flags, parent in elements:
+            if name in self.ids:
+                continue
+            name = sys.intern(str(name))
+            self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.curies.append(sys.intern(str(curie)))
+            self.kinds.append(ELEMENT_KINDS.index(kind))
+            self.flags.append(flags)
+            parent_names.append(parent)
+        self.parents.extend(self.ids.get(parent, -1) if parent else -1 for parent in parent_names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, element_id: int) -> bool:
+        return isinstance(element_id, int) and 0 <= element_id < len(self.names)
+
+    def kind(self, element_id: int) -> str:
+        """
+        Get the kind of an element.
+
+        Parameters
+        ----------
+        element_id: int
+            The id of the element
+
+        Returns
+        -------
+        str
+            ``class``, ``slot``, ``type``, ``enum`` or ``subset``
+
+        """
+        return ELEMENT_KINDS[self.kinds[element_id]]
+
+    def has_flag(self, element_id: int, flag: str) -> bool:
+        """
+        Determine whether an element has a flag.
+
+        Parameters
+        ----------
+        element_id: int
+            The id of the element
+        flag: str
+            ``mixin``, ``abstract``, ``multivalued``, ``canonical`` or ``symmetric``
+
+        Returns
+        -------
+        bool
+            That the element has the flag
+
+        """
+        return bool(self.flags[element_id] & ELEMENT_FLAGS[flag])
+
+    def parent(self, element_id: int) -> Optional[int]:
+        """
+        Get the id of the ``is_a`` parent of an element.
+
+        Parameters
+        ----------
+        element_id: int
+            The id of the element
+
+        Returns
+        -------
+        Optional[int]
+            The id of the parent, or None if the element has no parent
+
+        """
+        parent = self.parents[element_id]
+        return None if parent < 0 else parent
+
+    def select(self, kind: Optional[str] = None, flag: Optional[str] = None) -> List[int]:
+        """
+        Get the ids of the elements of a kind, or with a flag, or both.
+
+        Parameters
+        ----------
+        kind: Optional[str]
+            The kind of the elements
+        flag: Optional[str]
+            A flag of the elements
+
+        Returns
+        -------
+        List[int]
+            The ids of the elements, in order
+
+        """
+        kind_code = None if kind is None else ELEMENT_KINDS.index(kind)
+        bit = 0 if flag is None else ELEMENT_FLAGS[flag]
+        return [
+            element_id for element_id, (code, flags) in enumerate(zip(self.kinds, self.flags))
+            if (kind_code is None or code == kind_code) and flags & bit == bit
+        ]
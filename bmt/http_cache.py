@@ -0,0 +1,252 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+Url = str
+Path = str
+
+CACHE_DIR_ENV = "BMT_CACHE_DIR"
+OFFLINE_ENV = "BMT_OFFLINE"
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")), "bmt"
+)
+
+TIMEOUT = 30
+POOL_SIZE = 8
+
+# a GitHub raw URL whose ref is a release tag like v3.2.1 or a full commit hash
+pinned_pattern = re.compile(
+    r"^https://raw\.githubusercontent\.com/[^/]+/[^/]+/(refs/tags/)?(v?\d+\.\d+\.\d+|[0-9a-f]{40})/"
+)
+
+logger = logging.getLogger(__name__)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class OfflineError(ConnectionError):
+    """
+    Raised when a resource is needed in offline mode but is not in the cache.
+    """
+
+
+def get_session() -> requests.Session:
+    """
+    Get the ``requests.Session`` shared by all downloads, so that
+    connections to the same host are pooled and reused.
+
+    Returns
+    -------
+    requests.Session
+        The shared session
+
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the cache directory, as set by the ``BMT_CACHE_DIR`` environment variable.
+
+    Returns
+    -------
+    str
+        The path of the cache directory
+
+    """
+    return os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+
+
+def is_offline() -> bool:
+    """
+    Whether offline mode is enabled by the ``BMT_OFFLINE`` environment variable.
+
+    Returns
+    -------
+    bool
+        True if resources must only be served from the cache
+
+    """
+    return os.environ.get(OFFLINE_ENV, "").lower() in ("1", "true", "yes")
+
+
+def is_pinned(url: Url) -> bool:
+    """
+    Whether a URL points at a fixed version of a resource, i.e. it is a
+    raw.githubusercontent.com URL of a release tag or a commit hash, so
+    that a cached copy never needs to be revalidated.
+
+    Parameters
+    ----------
+    url: str
+        The URL of the resource
+
+    Returns
+    -------
+    bool
+        True if the URL is pinned to a version
+
+    """
+    return pinned_pattern.search(url) is not None
+
+
+def _url_key(url: Url) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _get_file_mode() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# the mode of files created with open(), as mkstemp only lets the owner read its files
+FILE_MODE = _get_file_mode()
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.chmod(tmp, FILE_MODE)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _read_entry(cache_dir: Path, url: Url) -> Optional[dict]:
+    entry_path = os.path.join(cache_dir, "urls", f"{_url_key(url)}.json")
+    try:
+        with open(entry_path) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not os.path.exists(os.path.join(cache_dir, "objects", entry["sha256"])):
+        return None
+    return entry
+
+
+def _store(cache_dir: Path, url: Url, response: requests.Response) -> dict:
+    content = response.content
+    sha256 = hashlib.sha256(content).hexdigest()
+    object_path = os.path.join(cache_dir, "objects", sha256)
+    if not os.path.exists(object_path):
+        _write_atomic(object_path, content)
+    entry = {
+        "url": url,
+        "sha256": sha256,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "fetched": time.time(),
+    }
+    entry_path = os.path.join(cache_dir, "urls", f"{_url_key(url)}.json")
+    _write_atomic(entry_path, json.dumps(entry).encode("utf-8"))
+    return entry
+
+
+def cached_path(url: Url, offline: Optional[bool] = None, cache_dir: Optional[Path] = None) -> Path:
+    """
+    Get the path of a local copy of a remote resource, downloading it if needed.
+
+    Downloads are stored by the SHA-256 of their content and indexed by URL.
+    Cached copies of pinned URLs (see ``is_pinned``) are used as they are,
+    while cached copies of other URLs are revalidated with the server using
+    their ETag and Last-Modified headers. If the server can't be reached,
+    a cached copy is used even if it may be stale.
+
+    Parameters
+    ----------
+    url: str
+        The URL of the resource
+    offline: Optional[bool]
+        Only use the cache and never the network; defaults to ``is_offline()``
+    cache_dir: Optional[str]
+        The cache directory; defaults to ``get_cache_dir()``
+
+    Returns
+    -------
+    str
+        The path of the cached copy of the resource
+
+    """
+    if offline is None:
+        offline = is_offline()
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+
+    entry = _read_entry(cache_dir, url)
+    if entry is None and offline:
+        raise OfflineError(f"{url} is not in the bmt cache at {cache_dir} and offline mode is enabled")
+    if entry is not None and (offline or is_pinned(url)):
+        return os.path.join(cache_dir, "objects", entry["sha256"])
+
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    try:
+        response = get_session().get(url, headers=headers, timeout=TIMEOUT)
+        if entry is None or response.status_code != 304:
+            response.raise_for_status()
+            entry = _store(cache_dir, url, response)
+    except requests.RequestException:
+        if entry is None:
+            raise
+        logger.warning("could not revalidate %s, using the cached copy", url)
+    return os.path.join(cache_dir, "objects", entry["sha256"])
+
+
+def fetch(url: Url, offline: Optional[bool] = None, cache_dir: Optional[Path] = None) -> bytes:
+    """
+    Get the content of a remote resource through the cache.
+
+    Parameters
+    ----------
+    url: str
+        The URL of the resource
+    offline: Optional[bool]
+        Only use the cache and never the network; defaults to ``is_offline()``
+    cache_dir: Optional[str]
+        The cache directory; defaults to ``get_cache_dir()``
+
+    Returns
+    -------
+    bytes
+        The content of the resource
+
+    """
+    with open(cached_path(url, offline, cache_dir), "rb") as f:
+        return f.read()
+
+
+def is_url(location) -> bool:
+    """
+    Whether a schema location is an http(s) URL.
+    """
+    return isinstance(location, str) and location.startswith(("http://", "https://"))
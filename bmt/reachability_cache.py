@@ -0,0 +1,184 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from typing import Callable, Iterable, List, Optional
+
+from bmt.http_cache import get_cache_dir
+
+Path = str
+
+# How long a fetched descendant set is used before it is fetched again, in seconds
+DEFAULT_TTL = 7 * 24 * 60 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS queries (
+    query TEXT PRIMARY KEY,
+    fetched REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS terms (
+    query TEXT NOT NULL,
+    term TEXT NOT NULL,
+    PRIMARY KEY (query, term)
+) WITHOUT ROWID;
+"""
+
+ReachabilityCacheInfo = namedtuple("ReachabilityCacheInfo", ["hits", "misses", "queries", "ttl"])
+
+
+class ReachabilityCache(object):
+    """
+    A SQLite cache of the terms reachable from the source nodes of an enum,
+    shared by all processes that use the same file.
+
+    Each descendant set is fetched once, as a whole, and then looked up
+    by (source nodes, relationship types, value) until it is older than
+    the TTL. The database is opened in WAL mode, so that processes can
+    read it while another one writes to it. Within a process, a fetch
+    only holds up the threads that look up the same query.
+
+    Parameters
+    ----------
+    path: Optional[str]
+        The path of the SQLite file. Defaults to ``reachability.sqlite`` in the bmt cache directory.
+    ttl: float
+        How long a descendant set is used before it is fetched again, in seconds
+
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_TTL) -> None:
+        self.path = path or os.path.join(get_cache_dir(), "reachability.sqlite")
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._query_locks = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        # connections must not be shared with forked worker processes
+        if self._connection is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def query_key(source_nodes: List[str], relationship_types: Optional[List[str]]) -> str:
+        """
+        Get the key of a reachability query.
+
+        Parameters
+        ----------
+        source_nodes: List[str]
+            The CURIEs of the source nodes
+        relationship_types: Optional[List[str]]
+            The CURIEs of the relationship types to follow
+
+        Returns
+        -------
+        str
+            The key of the query, independent of the order of the nodes and relationship types
+
+        """
+        return json.dumps([sorted(source_nodes), sorted(relationship_types or [])])
+
+    def contains(
+            self,
+            source_nodes: List[str],
+            relationship_types: Optional[List[str]],
+            value: str,
+            fetch: Callable[[], Iterable[str]],
+    ) -> bool:
+        """
+        Determine whether a value is reachable from the given source nodes.
+
+        Parameters
+        ----------
+        source_nodes: List[str]
+            The CURIEs of the source nodes
+        relationship_types: Optional[List[str]]
+            The CURIEs of the relationship types to follow
+        value: str
+            The CURIE of the candidate term
+        fetch: Callable[[], Iterable[str]]
+            Fetches all the terms reachable from the source nodes, if they
+            are not in the cache or are older than the TTL
+
+        Returns
+        -------
+        bool
+            That the value is reachable from the source nodes
+
+        """
+        query = self.query_key(source_nodes, relationship_types)
+        # only one thread fetches a query, without holding up lookups of other queries
+        with self._query_lock(query):
+            with self._lock:
+                connection = self._connect()
+                row = connection.execute("SELECT fetched FROM queries WHERE query = ?", (query,)).fetchone()
+                if row is not None and time.time() - row[0] <= self.ttl:
+                    self.hits += 1
+                    row = connection.execute(
+                        "SELECT 1 FROM terms WHERE query = ? AND term = ?", (query, str(value))
+                    ).fetchone()
+                    return row is not None
+                self.misses += 1
+            terms = set(map(str, fetch()))
+            with self._lock:
+                connection = self._connect()
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    connection.execute("DELETE FROM terms WHERE query = ?", (query,))
+                    connection.executemany(
+                        "INSERT INTO terms (query, term) VALUES (?, ?)", ((query, term) for term in terms)
+                    )
+                    connection.execute(
+                        "INSERT OR REPLACE INTO queries (query, fetched) VALUES (?, ?)", (query, time.time())
+                    )
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+                connection.execute("COMMIT")
+        return str(value) in terms
+
+    def _query_lock(self, query: str) -> threading.Lock:
+        with self._lock:
+            lock = self._query_locks.get(query)
+            if lock is None:
+                lock = self._query_locks[query] = threading.Lock()
+            return lock
+
+    def clear(self) -> None:
+        """
+        Remove all descendant sets from the cache and reset the counters.
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("DELETE FROM terms")
+            connection.execute("DELETE FROM queries")
+            connection.execute("COMMIT")
+            self.hits = self.misses = 0
+
+    def info(self) -> ReachabilityCacheInfo:
+        """
+        Get the counters of the cache.
+
+        Returns
+        -------
+        ReachabilityCacheInfo
+            The number of hits and misses of this process, the number of
+            descendant sets in the cache and the TTL
+
+        """
+        with self._lock:
+            queries = self._connect().execute("SELECT COUNT(*) FROM queries").fetchone()[0]
+            return ReachabilityCacheInfo(self.hits, self.misses, queries, self.ttl)
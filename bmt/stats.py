@@ -0,0 +1,270 @@
+import inspect
+import threading
+from bisect import bisect_left
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+
+from linkml_runtime.utils.schemaview import SchemaView
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+
+class LatencyHistogram(object):
+    """
+    Counts of durations in fixed buckets, with their sum.
+    """
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the histogram as a dict.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The ``count``, the ``sum`` in seconds and the cumulative ``buckets``,
+            keyed by their upper bound (``+Inf`` for the last one)
+
+        """
+        buckets = {}
+        total = 0
+        for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), self.counts):
+            total += count
+            buckets["+Inf" if bound == float("inf") else repr(bound)] = total
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class Stats(object):
+    """
+    Latency histograms of the calls made through a Toolkit, grouped by
+    where the time was spent: ``method`` for public Toolkit methods,
+    ``schemaview`` for SchemaView methods and ``ubergraph`` for Ubergraph queries.
+
+    When disabled, nothing is recorded and instrumented calls only pay
+    for checking the ``enabled`` flag.
+
+    Parameters
+    ----------
+    enabled: bool
+        Whether to record calls
+
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, group: str, name: str, seconds: float) -> None:
+        """
+        Record the duration of a call.
+
+        Parameters
+        ----------
+        group: str
+            The group of the call, like ``method``
+        name: str
+            The name of the method called
+        seconds: float
+            How long the call took
+
+        """
+        with self._lock:
+            histogram = self._histograms.get((group, name))
+            if histogram is None:
+                histogram = self._histograms[(group, name)] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    def clear(self) -> None:
+        """
+        Drop all recorded calls.
+        """
+        with self._lock:
+            self._histograms.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get the latency histograms of all the calls recorded.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Dict[str, Any]]]
+            The histogram of each method, by group and method name
+
+        """
+        with self._lock:
+            histograms = {key: histogram.to_dict() for key, histogram in self._histograms.items()}
+        groups = {}
+        for (group, name), histogram in sorted(histograms.items()):
+            groups.setdefault(group, {})[name] = histogram
+        return groups
+
+
+def timed(stats: Optional[Stats], group: str, name: str, function: Callable, *args, **kwargs) -> Any:
+    """
+    Call a function, recording its duration if stats are enabled.
+    """
+    if stats is None or not stats.enabled:
+        return function(*args, **kwargs)
+    start = perf_counter()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        stats.record(group, name, perf_counter() - start)
+
+
+def _instrument_method(method: Callable) -> Callable:
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        stats = self._stats
+        if not stats.enabled:
+            return method(self, *args, **kwargs)
+        start = perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            stats.record("method", name, perf_counter() - start)
+
+    return wrapper
+
+
+def uninstrumented(method: Callable) -> Callable:
+    """
+    Leave a public method out of ``instrumented``, like the methods that report stats.
+    """
+    method.instrumented = False
+    return method
+
+
+def instrumented(cls: type) -> type:
+    """
+    Record the latency of every public method of a class in the ``Stats``
+    held by its instances in ``_stats``. Times are inclusive of the public
+    methods that a method calls.
+    """
+    for name, attribute in list(vars(cls).items()):
+        if (
+                not name.startswith("_")
+                and inspect.isfunction(attribute)
+                and getattr(attribute, "instrumented", True)
+        ):
+            setattr(cls, name, _instrument_method(attribute))
+    return cls
+
+
+# SchemaView methods call each other, so only the outermost call of each thread is timed
+_schemaview_calls = threading.local()
+
+
+def _instrument_schemaview_method(name: str, method: Callable) -> Callable:
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        stats = self.__dict__.get("_bmt_stats")
+        if stats is None or not stats.enabled or getattr(_schemaview_calls, "active", False):
+            return method(self, *args, **kwargs)
+        _schemaview_calls.active = True
+        start = perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            stats.record("schemaview", name, perf_counter() - start)
+            _schemaview_calls.active = False
+
+    return wrapper
+
+
+def _getstate(self) -> Dict[str, Any]:
+    state = self.__dict__.copy()
+    state.pop("_bmt_stats", None)
+    return state
+
+
+TimedSchemaView = type(
+    "TimedSchemaView",
+    (SchemaView,),
+    {
+        "__module__": __name__,
+        "__doc__": "A SchemaView that records the time spent in its public methods in the Stats in ``_bmt_stats``.",
+        "__getstate__": _getstate,
+        **{
+            name: _instrument_schemaview_method(name, attribute)
+            for name, attribute in vars(SchemaView).items()
+            if not name.startswith("_")
+            and callable(attribute)
+            and not isinstance(attribute, (type, staticmethod, classmethod))
+        },
+    },
+)
+
+
+def to_prometheus(stats: Dict[str, Any], prefix: str = "bmt") -> str:
+    """
+    Format the dict returned by ``Toolkit.stats()`` in the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    stats: Dict[str, Any]
+        The stats of a Toolkit
+    prefix: str
+        The prefix of the metric names
+
+    Returns
+    -------
+    str
+        The metrics
+
+    """
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        if not samples:
+            return
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for suffix, labels, value in samples:
+            label_text = ",".join(f'{key}="{label}"' for key, label in labels.items())
+            lines.append(f"{prefix}_{name}{suffix}{{{label_text}}} {value}")
+
+    methods = stats.get("methods", {})
+    for name, field, help_text in (
+            ("method_calls_total", "calls", "Calls of Toolkit methods"),
+            ("method_cache_hits_total", "hits", "Cache hits of Toolkit methods"),
+            ("method_cache_misses_total", "misses", "Cache misses of Toolkit methods"),
+            ("method_cache_evictions_total", "evictions", "Cache evictions of Toolkit methods"),
+    ):
+        metric(name, "counter", help_text, [
+            ("", {"method": method}, values[field]) for method, values in methods.items() if field in values
+        ])
+    metric("method_cache_size", "gauge", "Results held in the caches of Toolkit methods", [
+        ("", {"method": method}, values["currsize"]) for method, values in methods.items() if "currsize" in values
+    ])
+    for group, help_text in (
+            ("method", "Latency of Toolkit methods"),
+            ("schemaview", "Time spent in SchemaView methods"),
+            ("ubergraph", "Time spent in Ubergraph queries"),
+    ):
+        if group == "method":
+            histograms = {method: values["latency"] for method, values in methods.items() if "latency" in values}
+        else:
+            histograms = stats.get(group, {})
+        samples = []
+        for method, histogram in histograms.items():
+            for bound, count in histogram["buckets"].items():
+                samples.append(("_bucket", {"method": method, "le": bound}, count))
+            samples.append(("_sum", {"method": method}, histogram["sum"]))
+            samples.append(("_count", {"method": method}, histogram["count"]))
+        metric(f"{group}_latency_seconds", "histogram", help_text, samples)
+    return "\n".join(lines) + "\n"
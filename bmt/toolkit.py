@@ -1,24 +1,48 @@
 import logging
+import pickle
 import yaml
 import csv
 import deprecation
-import requests
-from oaklib.implementations import UbergraphImplementation
-from functools import lru_cache, reduce
-
-from typing import List, Union, TextIO, Optional, Dict
-from linkml_runtime.utils.schemaview import SchemaView
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import reduce
+from inspect import signature
+from itertools import product
+from urllib.parse import urljoin
+
+from importlib.metadata import version as package_version
+from typing import Any, Callable, Iterable, List, Union, TextIO, Optional, Dict
+from linkml_runtime.utils.schemaview import SchemaView, load_schema_wrap
 from linkml_runtime.linkml_model.meta import (
     SchemaDefinition,
     Element,
     ElementName,
     Definition,
-    ClassDefinition,
     SlotDefinition,
 )
-from pprint import pprint
 
-from bmt.utils import format_element, parse_name
+try:
+    import numpy
+except ImportError:  # masks are returned as lists without numpy
+    numpy = None
+
+from bmt.cache import CacheInfo, CacheSpec, MethodCache, NegativeCache, NegativeCacheInfo, cached
+from bmt.curie import CurieCodec
+from bmt.elements import ABSTRACT, CANONICAL, MIXIN, MULTIVALUED, SYMMETRIC, ElementTable
+from bmt.http_cache import cached_path, fetch, is_url
+from bmt.reachability_cache import ReachabilityCache, ReachabilityCacheInfo
+from bmt.stats import Stats, TimedSchemaView, instrumented, timed, to_prometheus, uninstrumented
+from bmt.utils import (
+    format_element,
+    parse_name,
+    sentencecase_to_camelcase,
+    sentencecase_to_snakecase,
+    to_list,
+)
 
 Url = str
 Path = str
@@ -30,12 +54,60 @@ INFORES_MAP = 'https://raw.githubusercontent.com/biolink/biolink-model/v3.2.1/in
 NODE_PROPERTY = "node property"
 ASSOCIATION_SLOT = "association slot"
 RELATED_TO = "related to"
+# Kinds of mappings in order of specificity, after the untyped `mappings`
+MAPPING_KINDS = ("exact", "close", "related", "narrow", "broad")
+
+# Status codes of validate_triples
+TRIPLE_OK = 0
+UNKNOWN_PREDICATE = 1
+DOMAIN_VIOLATION = 2
+RANGE_VIOLATION = 3
+
+# Status codes of validate_qualifiers
+QUALIFIER_OK = 0
+UNKNOWN_QUALIFIER = 1
+UNCONSTRAINED_QUALIFIER = 2
+INVALID_QUALIFIER_VALUE = 3
 
 CACHE_SIZE = 1024
+NEGATIVE_CACHE_SIZE = 65536
+
+WarmInfo = namedtuple("WarmInfo", ["results", "seconds", "memory"])
+
+# Aligned columns of element names, CURIEs and kinds, with None for values that don't resolve
+ResolvedNames = namedtuple("ResolvedNames", ["names", "curies", "kinds"])
+
+# Marks values that were not looked up yet, as None is a valid lookup result
+_UNRESOLVED = object()
+
+SNAPSHOT_MAGIC = b"BMTSNAP\n"
+SNAPSHOT_FORMAT_VERSION = 1
 
 logger = logging.getLogger(__name__)
 
 
+class CachedSchemaView(TimedSchemaView):
+    """
+    A SchemaView that loads the relative imports of schemas loaded from a
+    URL through the bmt cache, so that they are cached and available offline
+    like the schemas that import them.
+    """
+
+    def load_import(self, imp: str, from_schema: Optional[SchemaDefinition] = None) -> SchemaDefinition:
+        if from_schema is None:
+            from_schema = self.schema
+        name = str(imp)
+        relative = ":" not in name and not name.startswith("/") and name not in self.importmap
+        if relative and is_url(from_schema.source_file):
+            url = urljoin(from_schema.source_file, f"{name}.yaml")
+            schema = load_schema_wrap(cached_path(url))
+            # the imports of the imported schema are relative to its URL too
+            schema.source_file = url
+            return schema
+        return super().load_import(imp, from_schema)
+
+
+@instrumented
 class Toolkit(object):
     """
     Provides a series of methods for performing lookups on the Biolink Model
@@ -44,36 +116,533 @@ class Toolkit(object):
     ----------
     schema: Union[str, TextIO, SchemaDefinition]
         The path or url to an instance of the biolink-model.yaml file.
+        Remote files are cached on disk, see ``bmt.http_cache``.
+    predicate_map: str
+        The url of the predicate mapping file.
+    infores_map: str
+        The url of the infores catalog.
+    eager_load: bool
+        Whether to load the predicate map, the infores catalog and the Ubergraph client
+        when the Toolkit is created instead of on first use. They are loaded concurrently
+        with the schema.
+    negative_cache_size: int
+        The number of names that don't resolve to any element to remember,
+        so that looking them up again is a single cache probe.
+    cache_config: Optional[Dict[str, Union[int, None, CacheSpec]]]
+        The cache size (None for no limit, 0 for no caching) or ``CacheSpec``
+        of size and eviction policy of cached methods, by method name.
+        Other methods keep their default size and policy.
+    collect_stats: bool
+        Whether to record the latency of method calls, see ``stats``.
 
     """
 
     def __init__(
             self, schema: Union[Url, Path, TextIO, SchemaDefinition] = REMOTE_PATH,
             predicate_map: Url = PREDICATE_MAP,
-            infores_map: Url = INFORES_MAP
+            infores_map: Url = INFORES_MAP,
+            eager_load: bool = False,
+            negative_cache_size: int = NEGATIVE_CACHE_SIZE,
+            cache_config: Optional[Dict[str, Union[int, None, CacheSpec]]] = None,
+            collect_stats: bool = False
     ) -> None:
-        self.oi = UbergraphImplementation()
-        self.view = SchemaView(schema)
-        r = requests.get(predicate_map)
-        self.pmap = yaml.safe_load(r.text)
-
-        r = requests.get(infores_map)
-        content = r.content.decode('iso-8859-1')
-        self.infores_map = {}
-        for line in csv.reader(content.splitlines(), delimiter='\t'):
-            if line[2] == 'id':
-                continue
-            self.infores_map[line[2]] = {
-                "status": line[0],
-                "name": line[1],
-                "url": line[3],
-                "synonyms": line[4],
-                "has_contributor": line[6],
-                "description": line[7],
-                "category": line[8]
+        self.predicate_map_url = predicate_map
+        self.infores_map_url = infores_map
+        self._init_state(negative_cache_size, cache_config, collect_stats)
+        start = time.perf_counter()
+        if eager_load:
+            with ThreadPoolExecutor(max_workers=len(self._LAZY_RESOURCES)) as executor:
+                # touching each property loads it
+                futures = [executor.submit(getattr, self, name) for name in self._LAZY_RESOURCES]
+                self.view = self._load_schema(schema)
+                for future in futures:
+                    future.result()
+        else:
+            self.view = self._load_schema(schema)
+        self._load_timings["total"] = time.perf_counter() - start
+
+    # Instance attributes that make up the state written by compile() and
+    # restored by from_snapshot()
+    _SNAPSHOT_ATTRIBUTES = ("view", "_pmap", "_infores_map", "_indexes", "_reachable_from")
+
+    # Properties that are loaded on first use
+    _LAZY_RESOURCES = ("pmap", "infores_map", "oi", "reachability_cache")
+
+    # Lookup indexes derived from the model, built on first use, by name of the method that builds them
+    _INDEX_BUILDERS = {
+        "elements": "_build_element_table",
+        "names": "_build_name_index",
+        "curie_table": "_build_curie_table",
+        "memberships": "_build_membership_index",
+        "domain_range": "_build_domain_range_index",
+        "qualifier_ranges": "_build_qualifier_range_index",
+        "closure": "_build_closure_index",
+        "slot_usage": "_build_slot_usage_index",
+        "id_prefixes": "_build_id_prefix_index",
+        "predicate_mappings": "_build_predicate_mapping_index",
+        "mappings": "_build_mapping_index",
+        "curies": "_build_curie_codec",
+    }
+
+    # Cached methods that warm() calls for every element of a kind, with every
+    # combination of their boolean flags. Methods that take no element are called once.
+    _WARM_METHODS = {
+        "get_all_elements": None,
+        "get_all_classes": None,
+        "get_all_slots": None,
+        "get_all_types": None,
+        "get_all_entities": None,
+        "get_all_associations": None,
+        "get_all_node_properties": None,
+        "get_all_edge_properties": None,
+        "get_all_multivalued_slots": None,
+        "get_model_version": None,
+        "get_element": "elements",
+        "get_ancestors": "elements",
+        "get_descendants": "elements",
+        "get_children": "elements",
+        "get_parent": "elements",
+        "is_category": "elements",
+        "is_predicate": "elements",
+        "is_translator_canonical_predicate": "elements",
+        "is_node_property": "elements",
+        "is_association_slot": "elements",
+        "is_qualifier": "elements",
+        "is_mixin": "elements",
+        "is_enum": "elements",
+        "has_inverse": "elements",
+        "get_inverse": "slots",
+        "get_slot_domain": "slots",
+        "get_slot_range": "slots",
+        "get_value_type_for_slot": "slots",
+        "get_all_slots_with_class_domain": "classes",
+        "get_all_slots_with_class_range": "classes",
+        "get_all_predicates_with_class_domain": "classes",
+        "get_all_predicates_with_class_range": "classes",
+        "get_all_properties_with_class_domain": "classes",
+        "get_all_properties_with_class_range": "classes",
+    }
+
+    def _init_state(
+            self,
+            negative_cache_size: int,
+            cache_config: Optional[Dict[str, Union[int, None, CacheSpec]]] = None,
+            collect_stats: bool = False
+    ) -> None:
+        self._stats = Stats(collect_stats)
+        self._pmap = None
+        self._infores_map = None
+        self._oi = None
+        self._reachable_from = None
+        self._reachability_cache = None
+        self._lazy_load_locks = {f"_{name}": threading.Lock() for name in self._LAZY_RESOURCES}
+        self._indexes = {}
+        self._index_lock = threading.RLock()
+        self._negative_cache = NegativeCache(negative_cache_size)
+        self._cache_config = dict(cache_config or {})
+        self._method_caches = {}
+        self._method_caches_lock = threading.Lock()
+        self._load_timings = {}
+
+    def _get_index(self, name: str) -> Any:
+        index = self._indexes.get(name)
+        if index is None:
+            # re-entrant, as some indexes are built from others
+            with self._index_lock:
+                index = self._indexes.get(name)
+                if index is None:
+                    with self._timed(f"{name} index"):
+                        index = getattr(self, self._INDEX_BUILDERS[name])()
+                    self._indexes[name] = index
+        return index
+
+    def _method_cache(self, name: str, default: CacheSpec) -> MethodCache:
+        cache = self._method_caches.get(name)
+        if cache is None:
+            with self._method_caches_lock:
+                cache = self._method_caches.get(name)
+                if cache is None:
+                    spec = self._cache_config.get(name, default)
+                    if not isinstance(spec, CacheSpec):
+                        spec = CacheSpec(spec, default.policy)
+                    cache = self._method_caches[name] = MethodCache(spec.maxsize, spec.policy)
+        return cache
+
+    def _get_lazy_resource(self, attr: str, loader: Callable[[], Any]) -> Any:
+        value = getattr(self, attr)
+        if value is None:
+            with self._lazy_load_locks[attr]:
+                value = getattr(self, attr)
+                if value is None:
+                    value = loader()
+                    setattr(self, attr, value)
+        return value
+
+    @contextmanager
+    def _timed(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._load_timings[phase] = time.perf_counter() - start
+            logger.debug("%s took %.3fs", phase, self._load_timings[phase])
+
+    @uninstrumented
+    def get_load_timings(self) -> Dict[str, float]:
+        """
+        Get the time spent loading the model and its resources.
+
+        Phases are only listed once they have run, so resources that are
+        loaded on first use show up after the first call that needs them.
+
+        Returns
+        -------
+        Dict[str, float]
+            The duration in seconds of each loading phase, keyed by phase
+
+        """
+        return dict(self._load_timings)
+
+    def _load_schema(self, schema: Union[Url, Path, TextIO, SchemaDefinition]) -> SchemaView:
+        url = None
+        if is_url(schema):
+            url = schema
+            with self._timed("schema fetch"):
+                schema = cached_path(schema)
+        with self._timed("schema parse"):
+            view = CachedSchemaView(schema)
+        if url is not None:
+            # relative imports are resolved against the source file, which must be the URL and not the cached copy
+            view.schema.source_file = url
+        view._bmt_stats = self._stats
+        return view
+
+    @property
+    def pmap(self) -> Dict[str, List[Dict[str, str]]]:
+        """
+        The predicate mapping, loaded from ``predicate_map_url`` on first use.
+        """
+        return self._get_lazy_resource("_pmap", self._load_predicate_map)
+
+    @pmap.setter
+    def pmap(self, pmap: Dict[str, List[Dict[str, str]]]) -> None:
+        self._pmap = pmap
+        # the predicate mapping index is derived from the predicate map
+        self._indexes.pop("predicate_mappings", None)
+
+    @property
+    def infores_map(self) -> Dict[str, Dict[str, str]]:
+        """
+        The infores catalog keyed by infores identifier, loaded from
+        ``infores_map_url`` on first use.
+        """
+        return self._get_lazy_resource("_infores_map", self._load_infores_map)
+
+    @infores_map.setter
+    def infores_map(self, infores_map: Dict[str, Dict[str, str]]) -> None:
+        self._infores_map = infores_map
+        cache = self._method_caches.get("get_infores_details")
+        if cache is not None:
+            cache.clear()
+
+    @property
+    def oi(self):
+        """
+        The Ubergraph client used for enum 'reachable_from' lookups, created on first use.
+        """
+        return self._get_lazy_resource("_oi", self._load_ubergraph)
+
+    @oi.setter
+    def oi(self, oi) -> None:
+        self._oi = oi
+
+    @property
+    def reachability_cache(self) -> ReachabilityCache:
+        """
+        The on-disk cache of Ubergraph results for enum 'reachable_from' lookups,
+        created on first use. Assign a ``ReachabilityCache`` to change its file or TTL.
+        """
+        return self._get_lazy_resource("_reachability_cache", ReachabilityCache)
+
+    @reachability_cache.setter
+    def reachability_cache(self, cache: ReachabilityCache) -> None:
+        self._reachability_cache = cache
+
+    @property
+    def curie_codec(self) -> CurieCodec:
+        """
+        The codec that expands CURIEs and contracts IRIs with the prefixes of the model, built on first use.
+        """
+        return self._get_index("curies")
+
+    @property
+    def element_table(self) -> ElementTable:
+        """
+        The classes, slots, types, enums and subsets of the model as arrays indexed by element id, built on first use.
+        """
+        return self._get_index("elements")
+
+    def _load_predicate_map(self) -> Dict[str, List[Dict[str, str]]]:
+        with self._timed("predicate map fetch"):
+            content = fetch(self.predicate_map_url)
+        with self._timed("predicate map parse"):
+            return yaml.safe_load(content.decode('utf-8'))
+
+    def _load_infores_map(self) -> Dict[str, Dict[str, str]]:
+        with self._timed("infores map fetch"):
+            content = fetch(self.infores_map_url).decode('iso-8859-1')
+        with self._timed("infores map parse"):
+            infores_map = {}
+            for line in csv.reader(content.splitlines(), delimiter='\t'):
+                if line[2] == 'id':
+                    continue
+                infores_map[line[2]] = {
+                    "status": line[0],
+                    "name": line[1],
+                    "url": line[3],
+                    "synonyms": line[4],
+                    "has_contributor": line[6],
+                    "description": line[7],
+                    "category": line[8]
+                }
+        return infores_map
+
+    def _load_ubergraph(self):
+        with self._timed("ubergraph client"):
+            # oaklib is slow to import, so only import it when Ubergraph is needed
+            from oaklib.implementations import UbergraphImplementation
+            return UbergraphImplementation()
+
+    def materialize_reachable_from(self, adapter: Any = None) -> Dict[str, int]:
+        """
+        Compute the set of terms that are reachable from each enum with a
+        ``reachable_from`` query, so that ``is_reachable_from_enum`` can
+        answer from memory instead of querying Ubergraph.
+
+        The sets are saved in snapshots written by ``compile``, so this is
+        meant to be run once, before compiling a snapshot.
+
+        Parameters
+        ----------
+        adapter: Any
+            An oaklib adapter, or an oaklib selector for one (for instance
+            ``sqlite:obo:uberon``) to query for the descendants of the source
+            nodes of each enum. Defaults to the Ubergraph client.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of reachable terms of each enum
+
+        """
+        if adapter is None:
+            adapter = self.oi
+        elif isinstance(adapter, str):
+            from oaklib import get_adapter
+            adapter = get_adapter(adapter)
+        reachable_from = {}
+        with self._timed("reachable from"):
+            for name, enum in self.view.all_enums().items():
+                query = enum.reachable_from
+                if query is not None and query.source_ontology:
+                    reachable_from[name] = self._get_descendant_terms(query, adapter)
+        self._reachable_from = reachable_from
+        return {name: len(terms) for name, terms in reachable_from.items()}
+
+    def _get_descendant_terms(self, query: Any, adapter: Any) -> frozenset:
+        def descendants():
+            return frozenset(adapter.descendants(query.source_nodes, query.relationship_types))
+        return timed(self._stats, "ubergraph", "descendants", descendants)
+
+    @uninstrumented
+    def warm(self, workers: int = 1, trace_memory: bool = False) -> WarmInfo:
+        """
+        Compute the results of the lookup methods for every element of the
+        model and every combination of their flags ahead of time, so that
+        later calls with element names are served from the method caches.
+
+        The caches of the warmed methods become unbounded, unless their size
+        was set with ``cache_config`` or ``configure_cache``. The results are
+        written into snapshots by ``compile``.
+
+        Parameters
+        ----------
+        workers: int
+            The number of threads to compute results with
+        trace_memory: bool
+            Whether to measure the memory allocated for the results with
+            ``tracemalloc``, which makes warming several times slower
+
+        Returns
+        -------
+        WarmInfo
+            The number of results computed, the time it took in seconds
+            and the memory allocated for them in bytes (None if it was not measured)
+
+        """
+        start_tracing = trace_memory and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0] if trace_memory else None
+        start = time.perf_counter()
+        try:
+            for name in self._INDEX_BUILDERS:
+                self._get_index(name)
+            universes = {
+                "elements": self.get_all_elements(),
+                "classes": self.get_all_classes(),
+                "slots": self.get_all_slots(),
             }
+            tasks = []
+            for method, kind in self._WARM_METHODS.items():
+                function = getattr(self, method)
+                flags = [
+                    parameter.name for parameter in signature(function).parameters.values()
+                    if isinstance(parameter.default, bool)
+                ]
+                combinations = [dict(zip(flags, values)) for values in product((False, True), repeat=len(flags))]
+                if method not in self._cache_config:
+                    self.configure_cache(method, None, getattr(type(self), method).cache_spec.policy)
+                if kind is None:
+                    tasks.append((function, (), combinations))
+                else:
+                    tasks.extend((function, (element,), combinations) for element in universes[kind])
+
+            def run(task):
+                function, args, combinations = task
+                for kwargs in combinations:
+                    function(*args, **kwargs)
+                return len(combinations)
 
-    @lru_cache(CACHE_SIZE)
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = sum(executor.map(run, tasks))
+            else:
+                results = sum(map(run, tasks))
+            seconds = time.perf_counter() - start
+            memory = tracemalloc.get_traced_memory()[0] - before if trace_memory else None
+        finally:
+            if start_tracing:
+                tracemalloc.stop()
+        self._load_timings["warm"] = seconds
+        return WarmInfo(results, seconds, memory)
+
+    def compile(self, path: Path) -> None:
+        """
+        Write the loaded model to a snapshot file.
+
+        The snapshot holds the resolved schema (with all of its imports),
+        the lookup indexes derived from it, the predicate map, the
+        infores catalog, the terms reachable from enums (if
+        ``materialize_reachable_from`` was run) and the cached method
+        results (all of them, if ``warm`` was run) in a single versioned
+        binary file that can be loaded with ``Toolkit.from_snapshot``
+        without fetching or parsing the model again.
+
+        Parameters
+        ----------
+        path: str
+            The path of the snapshot file to write
+
+        """
+        # resolve imports, load lazy resources and build all indexes up front
+        # so that the snapshot is self-contained
+        self.view.imports_closure()
+        self.view.all_elements()
+        self.pmap
+        self.infores_map
+        for name in self._INDEX_BUILDERS:
+            self._get_index(name)
+        header = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "model_version": self.get_model_version(),
+            "linkml_runtime": package_version("linkml-runtime"),
+        }
+        state = {attr: getattr(self, attr) for attr in self._SNAPSHOT_ATTRIBUTES}
+        with self._method_caches_lock:
+            caches = dict(self._method_caches)
+        state["method_caches"] = {
+            name: (CacheSpec(cache.maxsize, cache.policy), cache.items()) for name, cache in caches.items()
+        }
+        # schemas loaded from a URL carry an unpicklable hbreader path object, which is
+        # swapped for a plain string while pickling and then put back; assigning
+        # through the attribute would wrap it again
+        source_files = [
+            (schema, schema.source_file) for schema in self.view.schema_map.values() if schema.source_file is not None
+        ]
+        try:
+            for schema, source_file in source_files:
+                vars(schema)["source_file"] = str.__str__(source_file)
+            with open(path, "wb") as f:
+                f.write(SNAPSHOT_MAGIC)
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            for schema, source_file in source_files:
+                vars(schema)["source_file"] = source_file
+
+    @classmethod
+    def from_snapshot(
+            cls,
+            path: Path,
+            negative_cache_size: int = NEGATIVE_CACHE_SIZE,
+            cache_config: Optional[Dict[str, Union[int, None, CacheSpec]]] = None,
+            collect_stats: bool = False
+    ) -> "Toolkit":
+        """
+        Create a Toolkit from a snapshot file written by ``Toolkit.compile``.
+
+        Snapshots are pickles, so only load files from a trusted source.
+
+        Parameters
+        ----------
+        path: str
+            The path of the snapshot file
+        negative_cache_size: int
+            The number of names that don't resolve to any element to remember
+        cache_config: Optional[Dict[str, Union[int, None, CacheSpec]]]
+            The cache size or ``CacheSpec`` of cached methods, by method name
+        collect_stats: bool
+            Whether to record the latency of method calls, see ``stats``
+
+        Returns
+        -------
+        Toolkit
+            A Toolkit with the same model as the one that wrote the snapshot
+
+        """
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a bmt snapshot")
+            header = pickle.load(f)
+            if header.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(
+                    f"{path} has snapshot format version {header.get('format_version')}, "
+                    f"expected {SNAPSHOT_FORMAT_VERSION}"
+                )
+            linkml_runtime_version = package_version("linkml-runtime")
+            if header.get("linkml_runtime") != linkml_runtime_version:
+                logger.warning(
+                    "snapshot %s was written with linkml-runtime %s but %s is installed",
+                    path, header.get("linkml_runtime"), linkml_runtime_version
+                )
+            state = pickle.load(f)
+        method_caches = state.pop("method_caches", {})
+        toolkit = cls.__new__(cls)
+        toolkit.predicate_map_url = None
+        toolkit.infores_map_url = None
+        toolkit._init_state(negative_cache_size, cache_config, collect_stats)
+        toolkit.__dict__.update(state)
+        for name, (spec, items) in method_caches.items():
+            # the cache_config given here takes precedence over the sizes the snapshot was written with
+            toolkit._method_cache(name, spec).update(items)
+        if isinstance(toolkit.view, TimedSchemaView):
+            toolkit.view._bmt_stats = toolkit._stats
+        toolkit._load_timings["snapshot load"] = time.perf_counter() - start
+        return toolkit
+
+    @cached(None, formatted="formatted")
     def get_all_elements(self, formatted: bool = False) -> List[str]:
         """
         Get all elements from Biolink Model.
@@ -98,7 +667,7 @@ class Toolkit(object):
         all_elements = classes + slots + types
         return all_elements
 
-    @lru_cache(CACHE_SIZE)
+    @cached(None, formatted="formatted")
     def get_all_classes(self, formatted: bool = False) -> List[str]:
         """
         Get all classes from Biolink Model.
@@ -123,7 +692,7 @@ class Toolkit(object):
         filtered_classes = self._filter_secondary(classes)
         return self._format_all_elements(filtered_classes, formatted)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(None, formatted="formatted")
     def get_all_slots(self, formatted: bool = False) -> List[str]:
         """
         Get all slots from Biolink Model.
@@ -148,7 +717,7 @@ class Toolkit(object):
         filtered_slots = self._filter_secondary(slots)
         return self._format_all_elements(filtered_slots, formatted)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(None, formatted="formatted")
     def get_all_types(self, formatted: bool = False) -> List[str]:
         """
         Get all types from Biolink Model.
@@ -172,7 +741,7 @@ class Toolkit(object):
             types.append(x)
         return self._format_all_elements(types, formatted)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(None, formatted="formatted")
     def get_all_entities(self, formatted: bool = False) -> List[str]:
         """
         Get all entities from Biolink Model.
@@ -194,7 +763,7 @@ class Toolkit(object):
         elements = self.get_descendants("named thing")
         return self._format_all_elements(elements, formatted)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(None, formatted="formatted")
     def get_all_associations(self, formatted: bool = False) -> List[str]:
         """
         Get all associations from Biolink Model.
@@ -216,7 +785,7 @@ class Toolkit(object):
         elements = self.get_descendants("association")
         return self._format_all_elements(elements, formatted)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(None, formatted="formatted")
     def get_all_node_properties(self, formatted: bool = False) -> List[str]:
         """
         Get all node properties from Biolink Model.
@@ -240,7 +809,7 @@ class Toolkit(object):
         filtered_elements = self._filter_secondary(elements)
         return self._format_all_elements(filtered_elements, formatted)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(None, formatted="formatted")
     def get_all_edge_properties(self, formatted: bool = False) -> List[str]:
         """
         Get all edge properties from Biolink Model.
@@ -292,7 +861,7 @@ class Toolkit(object):
                 filtered_elements.append(e)
         return filtered_elements
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE)
     def get_permissible_value_ancestors(self, permissible_value: str, enum_name: str, formatted: bool = False) -> List[
         str]:
         """
@@ -319,7 +888,7 @@ class Toolkit(object):
             return self._format_all_elements(ancestors)
         return ancestors
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE)
     def get_infores_details(self, infores_id: str):
         """
         Get details of an information resource.
@@ -338,11 +907,9 @@ class Toolkit(object):
             A dictionary containing details of the information resource
 
         """
-        pprint(self.infores_map)
         infores = self.infores_map.get(infores_id)
         return infores
 
-    @lru_cache(CACHE_SIZE)
     def get_predicate_mapping(self, mapped_predicate: str) -> Dict[str, str]:
         """
         Get the predicates that map to a given predicate.
@@ -361,16 +928,102 @@ class Toolkit(object):
             A list of elements
 
         """
-        association = {}
+        return dict(self._get_index("predicate_mappings")["mapped"].get(mapped_predicate, {}))
+
+    def get_mapped_predicate(
+            self,
+            predicate: str,
+            qualifiers: Dict[str, str],
+            formatted: bool = False
+    ) -> Optional[str]:
+        """
+        Get the mapped predicate that a predicate and a set of qualifiers collapse to.
+
+        This is the reverse of ``get_predicate_mapping``: given, for instance,
+        ``affects`` with an ``object aspect qualifier`` of ``activity or abundance``
+        and an ``object direction qualifier`` of ``increased``, it returns ``augments``.
+
+        Parameters
+        ----------
+        predicate: str
+            The name or CURIE of the predicate
+        qualifiers: Dict[str, str]
+            The qualifiers, keyed by the name or CURIE of the qualifier
+        formatted: bool
+            Whether to format the mapped predicate as a CURIE
+
+        Returns
+        -------
+        Optional[str]
+            The mapped predicate, or None if no mapped predicate uses exactly these qualifiers
+
+        """
+        key = self._predicate_mapping_key(predicate, qualifiers)
+        mapped_predicate = self._get_index("predicate_mappings")["collapsed"].get(key)
+        if mapped_predicate is not None and formatted:
+            mapped_predicate = f"biolink:{sentencecase_to_snakecase(mapped_predicate)}"
+        return mapped_predicate
+
+    def _predicate_mapping_key(self, predicate: str, qualifiers: Dict[str, str]) -> tuple:
+        """
+        Normalize a predicate and its qualifiers into a key of the predicate mapping index.
+
+        Names and CURIEs of the predicate, the qualifiers and the qualified predicate
+        are resolved to element names, and underscores in other qualifier values
+        are read as spaces.
 
+        Parameters
+        ----------
+        predicate: str
+            The name or CURIE of the predicate
+        qualifiers: Dict[str, str]
+            The qualifiers, keyed by the name or CURIE of the qualifier
+
+        Returns
+        -------
+        tuple
+            The predicate name and the set of qualifier names and values
+
+        """
+        items = []
+        for qualifier, value in qualifiers.items():
+            qualifier = self._resolve_name(qualifier) or qualifier
+            if qualifier == "qualified predicate":
+                value = self._resolve_name(value) or value
+            else:
+                value = str(value).replace("_", " ")
+            items.append((qualifier, value))
+        return self._resolve_name(predicate) or predicate, frozenset(items)
+
+    def _build_predicate_mapping_index(self) -> Dict[str, Dict]:
+        """
+        Build the indexes of the predicate mappings.
+
+        Returns
+        -------
+        Dict[str, Dict]
+            The ``mapped`` index from each mapped predicate to its mapping, with
+            the keys formatted as CURIEs, and the ``collapsed`` index from each
+            predicate and set of qualifiers to the mapped predicate
+
+        """
+        mapped = {}
+        collapsed = {}
+        formatted_keys = {}
         for mp in self.pmap.values():
             for item in mp:
-                if item['mapped predicate'] == mapped_predicate:
-                    for k, v in item.items():
-                        association[format_element(self.get_element(k))] = v
-        return association
-
-    @lru_cache(CACHE_SIZE)
+                association = mapped.setdefault(item["mapped predicate"], {})
+                for k, v in item.items():
+                    if k not in formatted_keys:
+                        element = self.get_element(k)
+                        formatted_keys[k] = format_element(element) if element else k
+                    association[formatted_keys[k]] = v
+                qualifiers = {k: v for k, v in item.items() if self.is_qualifier(k)}
+                key = self._predicate_mapping_key(item.get("predicate"), qualifiers)
+                collapsed.setdefault(key, item["mapped predicate"])
+        return {"mapped": mapped, "collapsed": collapsed}
+
+    @cached(CACHE_SIZE)
     def get_permissible_value_parent(self, permissible_value: str, enum_name: str) -> str:
         """
         Get parent of a permissible value.
@@ -394,7 +1047,7 @@ class Toolkit(object):
         parent = self.view.permissible_value_parent(permissible_value, enum_name)
         return parent
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",), formatted="formatted")
     def get_ancestors(
             self,
             name: str,
@@ -422,16 +1075,114 @@ class Toolkit(object):
             The names of the given elements ancestors
 
         """
-        element = self.get_element(name)
-        ancs = []
-        if isinstance(element, ClassDefinition):
-            ancs = self.view.class_ancestors(element.name, mixins=mixin, reflexive=reflexive)
-        if isinstance(element, SlotDefinition):
-            ancs = self.view.slot_ancestors(element.name, mixins=mixin, reflexive=reflexive)
-            filtered_ancs = self._filter_secondary(ancs)
-        else:
-            filtered_ancs = ancs
-        return self._format_all_elements(filtered_ancs, formatted)
+        closure = self._get_index("closure")
+        element_id = closure["ids"].get(self._resolve_name(name))
+        if element_id is None:
+            return []
+        ancs = self._closure_names(closure["ancestors"][mixin][element_id], element_id, reflexive)
+        return self._format_all_elements(ancs, formatted)
+
+    def get_ancestor_ids(self, name: Union[str, int], reflexive: bool = True, mixin: bool = True) -> List[int]:
+        """
+        Gets the ids of the ancestors of an element, in the order of ``get_ancestors``.
+
+        Parameters
+        ----------
+        name: Union[str, int]
+            The name or id of an element in the Biolink Model
+        reflexive: bool
+            Whether to include the query element in the list of ancestors
+        mixin: bool
+            If True, then that means we want to find mixin ancestors as well as is_a ancestors
+
+        Returns
+        -------
+        List[int]
+            The ids of the given element's ancestors
+
+        """
+        closure = self._get_index("closure")
+        element_id = closure["ids"].get(self._resolve_name(name))
+        if element_id is None:
+            return []
+        return [i for i in closure["ancestors"][mixin][element_id] if reflexive or i != element_id]
+
+    def _closure_names(self, ids: List[int], element_id: int, reflexive: bool) -> List[str]:
+        names = self._get_index("closure")["names"]
+        return [names[i] for i in ids if reflexive or i != element_id]
+
+    def _build_closure_index(self) -> Dict[str, Any]:
+        """
+        Build the transitive closure of the class and slot hierarchies.
+
+        Elements are identified by their id in the element table, and ``ids``
+        maps the names of classes and slots to their ids. For each id, and with
+        and without mixins, the index holds the ordered (reflexive) lists of
+        ancestor and descendant ids and the set of ancestor ids as a bitset,
+        where bit ``i`` is set if element ``i`` is an ancestor. Types and enums
+        have no ancestors or descendants. Slots that are artifacts of
+        domain/range constraints are left out, as in ``_filter_secondary``.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The closure index
+
+        """
+        table = self._get_index("elements")
+        classes = self.view.all_classes()
+        ids = {name: table.ids[name] for name in list(classes) + list(self.view.all_slots())}
+        ancestors = {mixin: [[] for _ in range(len(table))] for mixin in (True, False)}
+        descendants = {mixin: [[] for _ in range(len(table))] for mixin in (True, False)}
+        ancestor_bits = {mixin: [0] * len(table) for mixin in (True, False)}
+        for element_name, element_id in ids.items():
+            if element_name in classes:
+                get_ancestors, get_descendants = self.view.class_ancestors, self.view.class_descendants
+            else:
+                get_ancestors, get_descendants = self.view.slot_ancestors, self.view.slot_descendants
+            for mixin in (True, False):
+                ancs = [ids[a] for a in self._filter_secondary(get_ancestors(element_name, mixins=mixin))]
+                desc = [ids[d] for d in self._filter_secondary(get_descendants(element_name, mixins=mixin))]
+                ancestors[mixin][element_id] = ancs
+                descendants[mixin][element_id] = desc
+                ancestor_bits[mixin][element_id] = reduce(lambda bits, i: bits | (1 << i), ancs, 0)
+        names = table.names
+        return {
+            "names": names,
+            "ids": ids,
+            "ancestors": ancestors,
+            "descendants": descendants,
+            "ancestor_bits": ancestor_bits,
+        }
+
+    def is_subclass_of(self, child: str, parent: str, mixin: bool = True) -> bool:
+        """
+        Determines whether an element is a descendant of another element,
+        or the element itself.
+
+        Parameters
+        ----------
+        child: str
+            The name or alias of a class or slot in the Biolink Model
+        parent: str
+            The name or alias of a class or slot in the Biolink Model
+        mixin: bool
+            If True, then that means we want to find mixin ancestors as well as is_a ancestors
+
+        Returns
+        -------
+        bool
+            That child is parent or descends from it
+        """
+        ids = self._get_index("closure")["ids"]
+        child_id = ids.get(self._resolve_name(child))
+        parent_id = ids.get(self._resolve_name(parent))
+        if child_id is None or parent_id is None:
+            return False
+        return self._is_subclass_of_id(child_id, parent_id, mixin)
+
+    def _is_subclass_of_id(self, child_id: int, parent_id: int, mixin: bool = True) -> bool:
+        return bool(self._get_index("closure")["ancestor_bits"][mixin][child_id] >> parent_id & 1)
 
     def _get_mixin_descendants(self, ancestors: List[ElementName]) -> List[ElementName]:
         mixins_parents = []
@@ -444,7 +1195,7 @@ class Toolkit(object):
                     mixins_parents = mixins_parents + mixin_parents
         return mixins_parents
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",), formatted="formatted")
     def get_descendants(
             self,
             name: str,
@@ -472,24 +1223,45 @@ class Toolkit(object):
             The names of the given element's descendants
 
         """
-        desc = []
-        filtered_desc = []
-        element = self.get_element(name)
-
-        if element:
-            if isinstance(element, ClassDefinition):
-                desc = self.view.class_descendants(element.name, mixins=mixin, reflexive=reflexive)
-            if isinstance(element, SlotDefinition):
-                desc = self.view.slot_descendants(element.name, mixins=mixin, reflexive=reflexive)
-                filtered_desc = self._filter_secondary(desc)
-            else:
-                filtered_desc = desc
-        else:
+        element_name = self._resolve_name(name)
+        if element_name is None:
             raise ValueError("not a valid biolink component")
+        closure = self._get_index("closure")
+        element_id = closure["ids"].get(element_name)
+        if element_id is None:
+            return []
+        desc = self._closure_names(closure["descendants"][mixin][element_id], element_id, reflexive)
+        return self._format_all_elements(desc, formatted)
+
+    def get_descendant_ids(self, name: Union[str, int], reflexive: bool = True, mixin: bool = True) -> List[int]:
+        """
+        Gets the ids of the descendants of an element, in the order of ``get_descendants``.
 
-        return self._format_all_elements(filtered_desc, formatted)
+        Parameters
+        ----------
+        name: Union[str, int]
+            The name or id of an element in the Biolink Model
+        reflexive: bool
+            Whether to include the query element in the list of descendants
+        mixin: bool
+            If True, then that means we want to find mixin descendants as well as is_a descendants
 
-    @lru_cache(CACHE_SIZE)
+        Returns
+        -------
+        List[int]
+            The ids of the given element's descendants
+
+        """
+        element_name = self._resolve_name(name)
+        if element_name is None:
+            raise ValueError("not a valid biolink component")
+        closure = self._get_index("closure")
+        element_id = closure["ids"].get(element_name)
+        if element_id is None:
+            return []
+        return [i for i in closure["descendants"][mixin][element_id] if reflexive or i != element_id]
+
+    @cached(None)
     def get_all_multivalued_slots(self) -> List[str]:
         """
         Gets a list of names of all multivalued slots.
@@ -500,14 +1272,10 @@ class Toolkit(object):
             The names of all multivalued slots
 
         """
-        multivalued_slots = []
-        slots = self.view.all_slots()
-        for slot_name, slot_def in slots.items():
-            if self.view.is_multivalued(slot_name):
-                multivalued_slots.append(slot_name)
-        return multivalued_slots
+        table = self.element_table
+        return [table.names[i] for i in table.select("slot", "multivalued")]
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",), formatted="formatted")
     def get_children(
             self, name: str, formatted: bool = False, mixin: bool = True
     ) -> List[str]:
@@ -535,7 +1303,7 @@ class Toolkit(object):
             children = self.view.get_children(element.name, mixin)
         return self._format_all_elements(children, formatted)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",), formatted="formatted")
     def get_parent(self, name: str, formatted: bool = False) -> Optional[str]:
         """
         Gets the name of the parent.
@@ -563,7 +1331,7 @@ class Toolkit(object):
                 parent = p
         return parent
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",))
     def get_element(self, name: str) -> Optional[Element]:
         """
         Gets an element that is identified by the given name, either as its name
@@ -580,21 +1348,397 @@ class Toolkit(object):
             The element identified by the given name
 
         """
-        parsed_name = parse_name(name)
-        logger.debug(parsed_name)
-        element = self.view.get_element(parsed_name)
-        if element is None and self.view.all_aliases() is not None:
-            for e in self.view.all_aliases():
-                if name in self.view.all_aliases()[e]:
-                    element = self.view.get_element(e)
-        if element is None and "_" in name:
-            element = self.get_element(name.replace("_", " "))
-        if element is None:
-            for e, el in self.view.all_elements().items():
-                if el.name.lower() == name.lower():
-                    element = el
-        return element
+        element_name = self._resolve_name(name)
+        if element_name is None:
+            return None
+        return self.view.get_element(element_name)
+
+    def get_elements(self, names: Iterable[Union[str, int]]) -> List[Optional[Element]]:
+        """
+        Gets the elements identified by the given names, resolving each distinct name once.
+
+        Parameters
+        ----------
+        names: Iterable[Union[str, int]]
+            The names, aliases or ids of elements in the Biolink Model,
+            as a list, an iterator or a NumPy or Arrow array
+
+        Returns
+        -------
+        List[Optional[Element]]
+            The element identified by each name, or None
+
+        """
+        values = to_list(names)
+        elements = dict.fromkeys(values)
+        for value in elements:
+            element_name = self._resolve_name(value)
+            if element_name is not None:
+                elements[value] = self.view.get_element(element_name)
+        return list(map(elements.__getitem__, values))
+
+    def resolve_many(self, names: Iterable[Union[str, int]]) -> ResolvedNames:
+        """
+        Resolve a column of names, aliases, CURIEs or ids of elements at once.
+
+        Each distinct value is resolved once, so the cost of a column grows
+        with the number of distinct values, and a lookup per row.
+
+        Parameters
+        ----------
+        names: Iterable[Union[str, int]]
+            The names, aliases, CURIEs or ids of elements in the Biolink Model,
+            as a list, an iterator or a NumPy or Arrow array
+
+        Returns
+        -------
+        ResolvedNames
+            The name, CURIE and kind (``class``, ``slot``, ``type``, ``enum`` or ``subset``)
+            of the element of each value, aligned with the values, or None
+            for values that don't resolve to an element
+
+        """
+        values = to_list(names)
+        table = self.element_table
+        curies = self._get_index("curie_table")["curies"]
+        element_names = dict.fromkeys(values)
+        element_curies = dict.fromkeys(element_names)
+        element_kinds = dict.fromkeys(element_names)
+        for value in element_names:
+            element_name = self._resolve_name(value)
+            if element_name is not None:
+                element_names[value] = element_name
+                element_curies[value] = curies[element_name]
+                element_kinds[value] = table.kind(table.ids[element_name])
+        return ResolvedNames(
+            list(map(element_names.__getitem__, values)),
+            list(map(element_curies.__getitem__, values)),
+            list(map(element_kinds.__getitem__, values)),
+        )
+
+    def _resolve_name(self, name: Union[str, int]) -> Optional[str]:
+        """
+        Resolve a name, alias, CURIE, differently cased or formatted
+        spelling or id of an element to the element's name.
+
+        Parameters
+        ----------
+        name: Union[str, int]
+            The name, alias or id of an element in the Biolink Model
+
+        Returns
+        -------
+        Optional[str]
+            The name of the element, or None if no element matches
+
+        """
+        if type(name) is int:
+            element_names = self._get_index("elements").names
+            return element_names[name] if 0 <= name < len(element_names) else None
+        if not isinstance(name, str):
+            return None
+        names = self._get_index("names")
+        element_name = names.get(name)
+        if element_name is None:
+            if name in self._negative_cache:
+                return None
+            element_name = names.get(name.lower())
+            if element_name is None:
+                parsed_name = parse_name(name)
+                element_name = names.get(parsed_name) or names.get(parsed_name.lower())
+            if element_name is None:
+                self._negative_cache.add(name)
+        return element_name
+
+    def get_element_id(self, name: Union[str, int]) -> Optional[int]:
+        """
+        Get the id of an element in the element table.
+
+        Ids are stable for a given model, and all methods that take an
+        element name also take an element id.
+
+        Parameters
+        ----------
+        name: Union[str, int]
+            The name, alias or id of an element in the Biolink Model
+
+        Returns
+        -------
+        Optional[int]
+            The id of the element, or None if no element matches
+
+        """
+        element_name = self._resolve_name(name)
+        if element_name is None:
+            return None
+        return self.element_table.ids.get(element_name)
+
+    def get_element_name(self, element_id: int, formatted: bool = False) -> Optional[str]:
+        """
+        Get the name of an element from its id.
+
+        Parameters
+        ----------
+        element_id: int
+            The id of an element in the element table
+        formatted: bool
+            Whether to format the name as a CURIE
+
+        Returns
+        -------
+        Optional[str]
+            The name of the element, or None if there is no element with this id
+
+        """
+        table = self.element_table
+        if element_id not in table:
+            return None
+        return table.curies[element_id] if formatted else table.names[element_id]
+
+    def _canonical_name(self, name: Any) -> Optional[str]:
+        """
+        Get the name that cached methods are called and keyed with for a
+        spelling of an element name, so that all spellings share one result.
+
+        Parameters
+        ----------
+        name: Any
+            The value of a name argument, which may be an element id
+
+        Returns
+        -------
+        Optional[str]
+            The name of the element, or None to use the value as it is
+
+        """
+        if not isinstance(name, (str, int)) or isinstance(name, bool):
+            return None
+        return self._resolve_name(name)
+
+    @uninstrumented
+    def configure_cache(self, method: str, maxsize: Optional[int], policy: str = "lru") -> None:
+        """
+        Change the size and eviction policy of the cache of a method,
+        dropping the results it holds.
+
+        Parameters
+        ----------
+        method: str
+            The name of a cached method, like ``get_element``
+        maxsize: Optional[int]
+            The maximum number of results to keep, None for no limit, or 0 to not cache results
+        policy: str
+            ``lru`` to evict the least recently used result when the cache is full,
+            or ``fifo`` to evict the oldest one
+
+        """
+        if not hasattr(getattr(type(self), method, None), "cache_spec"):
+            raise ValueError(f"{method} is not a cached method")
+        spec = CacheSpec(maxsize, policy)
+        cache = MethodCache(maxsize, policy)
+        with self._method_caches_lock:
+            self._cache_config[method] = spec
+            self._method_caches[method] = cache
+
+    @uninstrumented
+    def clear_caches(self) -> None:
+        """
+        Drop all cached results, including the names known not to resolve,
+        and reset the cache counters and the recorded latencies.
+        """
+        with self._method_caches_lock:
+            caches = list(self._method_caches.values())
+        for cache in caches:
+            cache.clear()
+        self._negative_cache.clear()
+        self._stats.clear()
+
+    @uninstrumented
+    def cache_info(self) -> Dict[str, CacheInfo]:
+        """
+        Get the counters of the caches of the methods that have been called.
+
+        Returns
+        -------
+        Dict[str, CacheInfo]
+            The number of hits, misses and evictions, the maximum and current size,
+            and the eviction policy of each method's cache
+
+        """
+        with self._method_caches_lock:
+            caches = dict(self._method_caches)
+        return {name: cache.info() for name, cache in caches.items()}
+
+    @uninstrumented
+    def enable_stats(self, enabled: bool = True) -> None:
+        """
+        Start or stop recording the latency of method calls.
+
+        Parameters
+        ----------
+        enabled: bool
+            Whether to record calls
+
+        """
+        self._stats.enabled = enabled
+
+    @uninstrumented
+    def stats(self, format: str = "dict") -> Union[Dict[str, Any], str]:
+        """
+        Get the call and cache statistics of this Toolkit.
 
+        Cache hits, misses and evictions are always counted. Call counts and
+        latency histograms of the public methods, of SchemaView and of
+        Ubergraph are only recorded while stats are enabled (see
+        ``collect_stats`` and ``enable_stats``). Method latencies include
+        the time spent in the methods they call.
+
+        Parameters
+        ----------
+        format: str
+            ``dict`` for a dict, or ``prometheus`` for the Prometheus text exposition format
+
+        Returns
+        -------
+        Union[Dict[str, Any], str]
+            The statistics of each method under ``methods``, and the latency
+            histograms of SchemaView and Ubergraph calls under ``schemaview``
+            and ``ubergraph``
+
+        """
+        if format not in ("dict", "prometheus"):
+            raise ValueError(f"unknown stats format {format!r}, expected 'dict' or 'prometheus'")
+        groups = self._stats.to_dict()
+        methods = {}
+        for name, histogram in groups.get("method", {}).items():
+            methods[name] = {"calls": histogram["count"], "latency": histogram}
+        for name, info in self.cache_info().items():
+            methods.setdefault(name, {}).update(
+                hits=info.hits,
+                misses=info.misses,
+                evictions=info.evictions,
+                maxsize=info.maxsize,
+                currsize=info.currsize,
+            )
+        stats = {
+            "enabled": self._stats.enabled,
+            "methods": methods,
+            "schemaview": groups.get("schemaview", {}),
+            "ubergraph": groups.get("ubergraph", {}),
+            "negative_cache": self.negative_cache_info()._asdict(),
+        }
+        if format == "prometheus":
+            return to_prometheus(stats)
+        return stats
+
+    @uninstrumented
+    def negative_cache_info(self) -> NegativeCacheInfo:
+        """
+        Get the counters of the cache of names that don't resolve to any element.
+
+        Returns
+        -------
+        NegativeCacheInfo
+            The number of hits, misses and evictions, and the maximum and current size
+
+        """
+        return self._negative_cache.info()
+
+    @uninstrumented
+    def reachability_cache_info(self) -> ReachabilityCacheInfo:
+        """
+        Get the counters of the on-disk cache of enum 'reachable_from' lookups.
+
+        Returns
+        -------
+        ReachabilityCacheInfo
+            The number of hits and misses, the number of cached descendant sets and the TTL
+
+        """
+        return self.reachability_cache.info()
+
+    def _build_element_table(self) -> ElementTable:
+        """
+        Build the table of all classes, slots, types, enums and subsets, in that order.
+
+        Slots are ``multivalued`` if the closest of themselves and their
+        ancestors that sets ``multivalued`` sets it to true, as in
+        ``SchemaView.is_multivalued``, without inducing the slots (which adds
+        the classes that use them to their ``domain_of``). They are
+        ``canonical`` if they have the ``canonical_predicate`` annotation.
+
+        Returns
+        -------
+        ElementTable
+            The element table
+
+        """
+        rows = []
+        for kind, elements in (
+                ("class", self.view.all_classes()),
+                ("slot", self.view.all_slots()),
+                ("type", self.view.all_types()),
+                ("enum", self.view.all_enums()),
+                ("subset", self.view.all_subsets()),
+        ):
+            for name, element in elements.items():
+                flags = 0
+                if getattr(element, "mixin", False):
+                    flags |= MIXIN
+                if getattr(element, "abstract", False):
+                    flags |= ABSTRACT
+                if kind == "slot":
+                    multivalued = next(
+                        (
+                            slot.multivalued for slot in map(self.view.get_slot, self.view.slot_ancestors(name))
+                            if slot.multivalued is not None
+                        ),
+                        False,
+                    )
+                    if multivalued:
+                        flags |= MULTIVALUED
+                    if "canonical_predicate" in element.annotations:
+                        flags |= CANONICAL
+                    if element.symmetric:
+                        flags |= SYMMETRIC
+                rows.append((name, format_element(element), kind, flags, getattr(element, "is_a", None)))
+        return ElementTable(rows)
+
+    def _build_name_index(self) -> Dict[str, str]:
+        """
+        Build the index from every spelling of every element to the element's name.
+
+        Names come first, then their snake_case, CamelCase and CURIE forms,
+        then aliases and finally lowercase forms of all of these, so that a
+        spelling always resolves to the element it matches most closely.
+
+        Returns
+        -------
+        Dict[str, str]
+            Element names keyed by spelling
+
+        """
+        index = {}
+        elements = self.view.all_elements()
+        for name in elements:
+            index.setdefault(name, name)
+        for name, element in elements.items():
+            snake = sentencecase_to_snakecase(name)
+            camel = sentencecase_to_camelcase(name)
+            for spelling in (
+                    name.replace(" ", "_"), snake, camel, format_element(element),
+                    f"biolink:{name.replace(' ', '_')}", f"biolink:{snake}", f"biolink:{camel}",
+            ):
+                index.setdefault(spelling, name)
+        for name, aliases in self.view.all_aliases().items():
+            for alias in aliases:
+                index.setdefault(alias, name)
+                index.setdefault(alias.replace(" ", "_"), name)
+        for spelling, name in list(index.items()):
+            index.setdefault(spelling.lower(), name)
+        return index
+
+    @cached(CACHE_SIZE, names=("slot_name",), formatted="formatted")
     def get_slot_domain(
             self,
             slot_name,
@@ -643,6 +1787,7 @@ class Toolkit(object):
                     slot_domain.append(d)
         return self._format_all_elements(slot_domain, formatted)
 
+    @cached(CACHE_SIZE, names=("slot_name",), formatted="formatted")
     def get_slot_range(
             self,
             slot_name,
@@ -714,6 +1859,113 @@ class Toolkit(object):
                         return True
         return False
 
+    def validate_qualifiers(
+            self,
+            types: Iterable[Union[str, int]],
+            values: Iterable[str],
+            reasons: bool = False,
+    ) -> Union[List[bool], List[int], Any]:
+        """
+        Validate (qualifier type, value) pairs, as ``validate_qualifier`` does for one pair.
+
+        The range of each distinct qualifier type is resolved once. Values of
+        qualifiers with an enum range are checked against the permissible
+        values of the enum and the terms reachable from it, and values of
+        qualifiers with a class range against the classes their prefix is an
+        id prefix of. Each distinct pair is checked once.
+
+        Parameters
+        ----------
+        types: Iterable[Union[str, int]]
+            The names, CURIEs or ids of the qualifiers
+        values: Iterable[str]
+            The values of the qualifiers, aligned with the types
+        reasons: bool
+            Whether to return the status of each pair instead of whether it is valid
+
+        Returns
+        -------
+        Union[List[bool], List[int], numpy.ndarray]
+            Whether each pair is valid or, if ``reasons`` is True, its status:
+            ``QUALIFIER_OK``, ``UNKNOWN_QUALIFIER`` if the type is not a
+            qualifier, ``UNCONSTRAINED_QUALIFIER`` if the qualifier has no range
+            to check the value against or ``INVALID_QUALIFIER_VALUE``. As a
+            NumPy array or, if NumPy is not installed, a list.
+
+        """
+        types, values = to_list(types), to_list(values)
+        if len(types) != len(values):
+            raise ValueError("types and values must have the same length")
+        qualifier_ranges = self._get_index("qualifier_ranges")
+        id_prefixes = self._get_index("id_prefixes")
+        reachable_from = self._reachable_from or {}
+        ids = self.element_table.ids
+        ranges = {
+            qualifier_type: qualifier_ranges.get(ids.get(self._resolve_name(qualifier_type)), _UNRESOLVED)
+            for qualifier_type in dict.fromkeys(types)
+        }
+
+        def status(qualifier_type, value):
+            qualifier_range = ranges[qualifier_type]
+            if qualifier_range is _UNRESOLVED:
+                return UNKNOWN_QUALIFIER
+            if qualifier_range is None:
+                return UNCONSTRAINED_QUALIFIER
+            if not value or not isinstance(value, str):
+                return INVALID_QUALIFIER_VALUE
+            enum_name, range_name, permissible_values = qualifier_range
+            if enum_name is not None:
+                if value in permissible_values:
+                    return QUALIFIER_OK
+                if enum_name in reachable_from:
+                    valid = value in reachable_from[enum_name]
+                else:
+                    valid = self.is_reachable_from_enum(enum_name, value)
+            else:
+                parts = CurieCodec.split(value)
+                valid = parts is not None and any(
+                    name == range_name for name, _ in id_prefixes.get(parts[0].lower(), ())
+                )
+            return QUALIFIER_OK if valid else INVALID_QUALIFIER_VALUE
+
+        pairs = dict.fromkeys(zip(types, values))
+        for pair in pairs:
+            pairs[pair] = status(*pair)
+        statuses = map(pairs.__getitem__, zip(types, values))
+        if not reasons:
+            statuses = (code == QUALIFIER_OK for code in statuses)
+        if numpy is None:
+            return list(statuses)
+        return numpy.fromiter(statuses, dtype=numpy.int8 if reasons else bool, count=len(types))
+
+    def _build_qualifier_range_index(self) -> Dict[int, Optional[tuple]]:
+        """
+        Build the ranges that qualifier values are validated against.
+
+        Returns
+        -------
+        Dict[int, Optional[tuple]]
+            For each qualifier id, the name of its enum range, the name of its
+            range and the permissible values of the enum, or None where the
+            qualifier has no range. The enum name and permissible values are
+            None for qualifiers whose range is not an enum.
+
+        """
+        names = self.element_table.names
+        index = {}
+        for qualifier_id in self._get_index("memberships")[("qualifier", True)]:
+            slot = self.view.get_slot(names[qualifier_id])
+            if slot is None or slot.range is None:
+                index[qualifier_id] = None
+                continue
+            enum = self.view.get_enum(slot.range)
+            if enum is not None:
+                index[qualifier_id] = (enum.name, slot.range, frozenset(enum.permissible_values))
+            else:
+                index[qualifier_id] = (None, slot.range, None)
+        return index
+
+    @cached(CACHE_SIZE, names=("class_name",), formatted="formatted")
     def get_all_slots_with_class_domain(
             self,
             class_name,
@@ -742,10 +1994,10 @@ class Toolkit(object):
 
         """
         element = self.get_element(class_name)
-        slots = self._get_all_slots_with_class_domain(element, check_ancestors, mixin)
-        slot_names = [x.name for x in slots]
-        return self._format_all_elements(slot_names, formatted)
+        slots = self._get_slots_with_class(element, "domain", check_ancestors, mixin)["slots"]
+        return self._format_all_elements(list(slots), formatted)
 
+    @cached(CACHE_SIZE, names=("class_name",), formatted="formatted")
     def get_all_slots_with_class_range(
             self,
             class_name,
@@ -774,10 +2026,10 @@ class Toolkit(object):
 
         """
         element = self.get_element(class_name)
-        slots = self._get_all_slots_with_class_range(element, check_ancestors, mixin)
-        slot_names = [x.name for x in slots]
-        return self._format_all_elements(slot_names, formatted)
+        slots = self._get_slots_with_class(element, "range", check_ancestors, mixin)["slots"]
+        return self._format_all_elements(list(slots), formatted)
 
+    @cached(CACHE_SIZE, names=("class_name",), formatted="formatted")
     def get_all_predicates_with_class_domain(
             self,
             class_name,
@@ -805,17 +2057,11 @@ class Toolkit(object):
             A list of slots
 
         """
-        filtered_slots = []
         element = self.get_element(class_name)
-        if element:
-            slots = self._get_all_slots_with_class_domain(
-                element, check_ancestors, mixin
-            )
-            for s in slots:
-                if not s.alias and RELATED_TO in self.get_ancestors(s.name, mixin):
-                    filtered_slots.append(s.name)
-        return self._format_all_elements(filtered_slots, formatted)
+        slots = self._get_slots_with_class(element, "domain", check_ancestors, mixin)["predicates"]
+        return self._format_all_elements(list(slots), formatted)
 
+    @cached(CACHE_SIZE, names=("class_name",), formatted="formatted")
     def get_all_predicates_with_class_range(
             self,
             class_name,
@@ -843,17 +2089,11 @@ class Toolkit(object):
             A list of slots
 
         """
-        filtered_slots = []
         element = self.get_element(class_name)
-        if element:
-            slots = self._get_all_slots_with_class_range(
-                element, check_ancestors, mixin
-            )
-            for s in slots:
-                if not s.alias and RELATED_TO in self.get_ancestors(s.name, mixin):
-                    filtered_slots.append(s.name)
-        return self._format_all_elements(filtered_slots, formatted)
+        slots = self._get_slots_with_class(element, "range", check_ancestors, mixin)["predicates"]
+        return self._format_all_elements(list(slots), formatted)
 
+    @cached(CACHE_SIZE, names=("class_name",), formatted="formatted")
     def get_all_properties_with_class_domain(
             self,
             class_name,
@@ -881,17 +2121,11 @@ class Toolkit(object):
             A list of slots
 
         """
-        filtered_slots = []
         element = self.get_element(class_name)
-        if element:
-            slots = self._get_all_slots_with_class_domain(
-                element, check_ancestors, mixin
-            )
-            for s in slots:
-                if not s.alias and RELATED_TO not in self.get_ancestors(s.name, mixin):
-                    filtered_slots.append(s.name)
-        return self._format_all_elements(filtered_slots, formatted)
+        slots = self._get_slots_with_class(element, "domain", check_ancestors, mixin)["properties"]
+        return self._format_all_elements(list(slots), formatted)
 
+    @cached(CACHE_SIZE, names=("class_name",), formatted="formatted")
     def get_all_properties_with_class_range(
             self,
             class_name,
@@ -919,17 +2153,11 @@ class Toolkit(object):
             A list of slots
 
         """
-        filtered_slots = []
         element = self.get_element(class_name)
-        if element:
-            slots = self._get_all_slots_with_class_range(
-                element, check_ancestors, mixin
-            )
-            for s in slots:
-                if not s.alias and RELATED_TO not in self.get_ancestors(s.name, mixin):
-                    filtered_slots.append(s.name)
-        return self._format_all_elements(filtered_slots, formatted)
+        slots = self._get_slots_with_class(element, "range", check_ancestors, mixin)["properties"]
+        return self._format_all_elements(list(slots), formatted)
 
+    @cached(CACHE_SIZE, names=("slot_name",), formatted="formatted")
     def get_value_type_for_slot(self, slot_name, formatted: bool = False) -> str:
         """
         Get the value type for a given slot.
@@ -963,73 +2191,91 @@ class Toolkit(object):
                 element_type = et
         return element_type
 
-    def _get_all_slots_with_class_domain(
-            self, element: Element, check_ancestors: bool, mixin: bool = True
-    ) -> List[Element]:
+    def _get_slots_with_class(
+            self, element: Optional[Element], relation: str, check_ancestors: bool, mixin: bool = True
+    ) -> Dict[str, tuple]:
         """
-        Given a class, get all the slots where the class is the domain.
+        Given a class, get the slots where the class is the domain or the range,
+        split into predicates and properties.
 
         Parameters
         ----------
-        element: linkml_model.meta.Element
+        element: Optional[linkml_model.meta.Element]
             An element
+        relation: str
+            Either ``domain`` or ``range``
         check_ancestors: bool
-            Whether or not to lookup slots that include ancestors of the given class as its domain
+            Whether or not to lookup slots that include ancestors of the given class as its domain or range
         mixin:
             If True, then that means we want to find mixin ancestors as well as is_a ancestors
 
         Returns
         -------
-        List[linkml_model.meta.Element]
-            A list of slots
+        Dict[str, tuple]
+            The names of all the ``slots``, of the ``predicates`` and of the ``properties``
 
         """
-        slots = []
-        for k, v in self.view.schema.slots.items():
-            if check_ancestors:
-                if (v.domain == element.name or v.domain in self.get_ancestors(element.name, mixin)
-                        or element.name in v.domain_of
-                        or any(v.domain_of) in self.get_ancestors(element.name, mixin)):
-                    slots.append(v)
-            else:
-                if element.name == v.domain or element.name in v.domain_of:
-                    slots.append(v)
-        return slots
+        index = self._get_index("slot_usage")[(relation, check_ancestors, mixin)]
+        if element is None or element.name not in index:
+            return {"slots": (), "predicates": (), "properties": ()}
+        return index[element.name]
 
-    def _get_all_slots_with_class_range(
-            self, element: Element, check_ancestors: bool, mixin: bool = True
-    ) -> List[Element]:
+    def _build_slot_usage_index(self) -> Dict[tuple, Dict[str, Dict[str, tuple]]]:
         """
-        Given a class, get all the slots where the class is the range.
+        Build an inverted index from classes to the slots that have the class
+        as their domain (or in their ``domain_of``) or as their range.
 
-        Parameters
-        ----------
-        element: linkml_model.meta.Element
-            An element
-        check_ancestors: bool
-            Whether or not to lookup slots that include ancestors of the given class as its range
-        mixin: bool
-            If True, then that means we want to find mixin ancestors as well as is_a ancestors
+        The index is keyed by ``(relation, check_ancestors, mixin)``. Under
+        ``check_ancestors``, a slot matches a class if its domain or range is
+        the class or one of its ancestors, or if the class is in its ``domain_of``.
+        Each entry holds the matching slots in model order, along with the ones
+        that are predicates and the ones that are properties.
 
         Returns
         -------
-        List[linkml_model.meta.Element]
-            A list of slots
-
-        """
-        slots = []
-        for k, v in self.view.schema.slots.items():
-            if check_ancestors:
-                if v.range == element.name or v.range in self.get_ancestors(
-                        element.name, mixin
-                ):
-                    slots.append(v)
-            else:
-                if v.range and element.name == v.range:
-                    slots.append(v)
-        return slots
-
-    @lru_cache(CACHE_SIZE)
+        Dict[tuple, Dict[str, Dict[str, tuple]]]
+            The slot usage index
+
+        """
+        slots = list(self.view.schema.slots.values())
+        by_domain, by_domain_of, by_range = {}, {}, {}
+        for position, slot in enumerate(slots):
+            if slot.domain:
+                by_domain.setdefault(slot.domain, []).append(position)
+            for class_name in slot.domain_of:
+                by_domain_of.setdefault(class_name, []).append(position)
+            if slot.range:
+                by_range.setdefault(slot.range, []).append(position)
+
+        def partition(positions, mixin):
+            names = tuple(slots[p].name for p in sorted(set(positions)))
+            proper = [s for s in names if not self.view.schema.slots[s].alias]
+            predicates = tuple(s for s in proper if self.is_subclass_of(s, RELATED_TO, mixin))
+            properties = tuple(s for s in proper if not self.is_subclass_of(s, RELATED_TO, mixin))
+            return {"slots": names, "predicates": predicates, "properties": properties}
+
+        closure = self._get_index("closure")
+        class_names = set(closure["ids"]) | set(by_domain) | set(by_domain_of) | set(by_range)
+        index = {}
+        for mixin in (True, False):
+            for check_ancestors in (True, False):
+                domain, range_ = {}, {}
+                for class_name in class_names:
+                    element_id = closure["ids"].get(class_name)
+                    if check_ancestors and element_id is not None:
+                        ancestors = [closure["names"][i] for i in closure["ancestors"][mixin][element_id]]
+                    else:
+                        ancestors = [class_name]
+                    domain_positions = [p for a in ancestors for p in by_domain.get(a, [])]
+                    domain_positions += by_domain_of.get(class_name, [])
+                    range_positions = [p for a in ancestors for p in by_range.get(a, [])]
+                    domain[class_name] = partition(domain_positions, mixin)
+                    range_[class_name] = partition(range_positions, mixin)
+                index[("domain", check_ancestors, mixin)] = domain
+                index[("range", check_ancestors, mixin)] = range_
+        return index
+
+    @cached(CACHE_SIZE, names=("name",))
     def is_node_property(self, name: str, mixin: bool = True) -> bool:
         """
         Determines whether the given name is the name of a node property
@@ -1048,9 +2294,9 @@ class Toolkit(object):
         bool
             That the named element is a valid node property in Biolink Model
         """
-        return NODE_PROPERTY in self.get_ancestors(name, mixin)
+        return self.is_subclass_of(name, NODE_PROPERTY, mixin)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",))
     def is_association_slot(self, name: str, mixin: bool = True) -> bool:
         """
         Determines whether the given name is the name of an association slot
@@ -1069,9 +2315,9 @@ class Toolkit(object):
         bool
             That the named element is a valid an association slot in Biolink Model
         """
-        return ASSOCIATION_SLOT in self.get_ancestors(name, mixin)
+        return self.is_subclass_of(name, ASSOCIATION_SLOT, mixin)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",))
     def is_predicate(self, name: str, mixin: bool = True) -> bool:
         """
         Determines whether the given name is the name of a relation/predicate
@@ -1090,9 +2336,9 @@ class Toolkit(object):
         bool
             That the named element is a valid relation/predicate in Biolink Model
         """
-        return RELATED_TO in self.get_ancestors(name, mixin)
+        return self.is_subclass_of(name, RELATED_TO, mixin)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",))
     def is_translator_canonical_predicate(self, name: str, mixin: bool = True) -> bool:
         """
         Determines whether the given name is the name of a canonical relation/predicate
@@ -1123,11 +2369,11 @@ class Toolkit(object):
         )
         return (
             True
-            if RELATED_TO in self.get_ancestors(name, mixin) and is_canonical
+            if self.is_subclass_of(name, RELATED_TO, mixin) and is_canonical
             else False
         )
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",))
     def is_mixin(self, name: str) -> bool:
         """
         Determines whether the given name is the name of a mixin
@@ -1147,11 +2393,11 @@ class Toolkit(object):
         is_mixin = element.mixin if isinstance(element, Definition) else False
         return is_mixin
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("slot_name",))
     def get_inverse(self, slot_name: str):
         return self.view.inverse(slot_name)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",))
     def has_inverse(self, name: str) -> bool:
         """
         Determines whether the given name is a predicate and if that predicate has an inverse defined
@@ -1172,7 +2418,7 @@ class Toolkit(object):
         has_inverse = element.inverse if isinstance(element, SlotDefinition) else False
         return bool(has_inverse)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",))
     def in_subset(self, name: str, subset: str) -> bool:
         """
         Determines whether the given name is in a given subset
@@ -1195,7 +2441,7 @@ class Toolkit(object):
         element = self.view.get_element(parsed_name)
         return subset in element.in_subset
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",))
     def is_category(self, name: str, mixin: bool = True) -> bool:
         """
         Determines whether the given name is the name of a category in the
@@ -1214,9 +2460,9 @@ class Toolkit(object):
         bool
             That the named element is a valid category in Biolink Model
         """
-        return "named thing" in self.get_ancestors(name, mixin)
+        return self.is_subclass_of(name, "named thing", mixin)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("name",))
     def is_qualifier(self, name: str) -> bool:
         """
         Predicate to test (by name) if a given Biolink Model element is an Edge Qualifier.
@@ -1232,12 +2478,218 @@ class Toolkit(object):
             That the named element is a valid edge qualifier in the Biolink Model
         """
 
-        if self.view.get_slot(parse_name(name)) and "qualifier" in self.view.slot_ancestors(parse_name(name)):
-            return True
-        else:
-            return False
+        return self.view.get_slot(parse_name(name)) is not None and self.is_subclass_of(parse_name(name), "qualifier")
+
+    def is_category_mask(self, names: Iterable[Union[str, int]], mixin: bool = True) -> Union[List[bool], Any]:
+        """
+        Test a whole column of names with ``is_category`` at once.
+
+        Parameters
+        ----------
+        names: Iterable[Union[str, int]]
+            The names, aliases, CURIEs or ids of elements,
+            as a list, an iterator or a NumPy or Arrow array
+        mixin: bool
+            If True, then that means we want to find mixin ancestors as well as is_a ancestors
 
-    @lru_cache(CACHE_SIZE)
+        Returns
+        -------
+        Union[List[bool], numpy.ndarray]
+            A boolean NumPy array, or a list if NumPy is not installed,
+            that is True where the name is the name of a category
+
+        """
+        return self._membership_mask(names, self._get_index("memberships")[("category", mixin)])
+
+    def is_predicate_mask(self, names: Iterable[Union[str, int]], mixin: bool = True) -> Union[List[bool], Any]:
+        """
+        Test a whole column of names with ``is_predicate`` at once.
+
+        Parameters
+        ----------
+        names: Iterable[Union[str, int]]
+            The names, aliases, CURIEs or ids of elements,
+            as a list, an iterator or a NumPy or Arrow array
+        mixin: bool
+            If True, then that means we want to find mixin ancestors as well as is_a ancestors
+
+        Returns
+        -------
+        Union[List[bool], numpy.ndarray]
+            A boolean NumPy array, or a list if NumPy is not installed,
+            that is True where the name is the name of a predicate
+
+        """
+        return self._membership_mask(names, self._get_index("memberships")[("predicate", mixin)])
+
+    def is_qualifier_mask(self, names: Iterable[Union[str, int]]) -> Union[List[bool], Any]:
+        """
+        Test a whole column of names with ``is_qualifier`` at once.
+
+        Parameters
+        ----------
+        names: Iterable[Union[str, int]]
+            The names, aliases, CURIEs or ids of elements,
+            as a list, an iterator or a NumPy or Arrow array
+
+        Returns
+        -------
+        Union[List[bool], numpy.ndarray]
+            A boolean NumPy array, or a list if NumPy is not installed,
+            that is True where the name is the name of a qualifier
+
+        """
+        return self._membership_mask(names, self._get_index("memberships")[("qualifier", True)])
+
+    def _membership_mask(self, names: Iterable[Union[str, int]], members: frozenset) -> Union[List[bool], Any]:
+        values = to_list(names)
+        ids = self.element_table.ids
+        distinct = dict.fromkeys(values)
+        for value in distinct:
+            element_name = self._resolve_name(value)
+            distinct[value] = element_name is not None and ids[element_name] in members
+        if numpy is None:
+            return list(map(distinct.__getitem__, values))
+        return numpy.fromiter(map(distinct.__getitem__, values), dtype=bool, count=len(values))
+
+    def validate_triples(
+            self,
+            subjects: Iterable[Union[str, int]],
+            predicates: Iterable[Union[str, int]],
+            objects: Iterable[Union[str, int]],
+            mixin: bool = True,
+    ) -> Union[List[int], Any]:
+        """
+        Check (subject category, predicate, object category) triples against
+        the domain and range of their predicates.
+
+        A predicate without a domain or range of its own has the one of its
+        closest ancestor. A subject category satisfies the domain if it is
+        the domain class or a descendant of it, and an object category
+        satisfies the range in the same way. Each distinct triple is checked once.
+
+        Parameters
+        ----------
+        subjects: Iterable[Union[str, int]]
+            The names, CURIEs or ids of the subject categories
+        predicates: Iterable[Union[str, int]]
+            The names, CURIEs or ids of the predicates, aligned with the subjects
+        objects: Iterable[Union[str, int]]
+            The names, CURIEs or ids of the object categories, aligned with the subjects
+        mixin: bool
+            If True, then that means we want to find mixin ancestors as well as is_a ancestors
+
+        Returns
+        -------
+        Union[List[int], numpy.ndarray]
+            The status of each triple, as a NumPy array or, if NumPy is not
+            installed, a list: ``TRIPLE_OK``, ``UNKNOWN_PREDICATE`` if the
+            predicate is not a predicate, ``DOMAIN_VIOLATION`` if the subject
+            doesn't satisfy its domain or ``RANGE_VIOLATION`` if the object
+            doesn't satisfy its range
+
+        """
+        subjects, predicates, objects = to_list(subjects), to_list(predicates), to_list(objects)
+        if not len(subjects) == len(predicates) == len(objects):
+            raise ValueError("subjects, predicates and objects must have the same length")
+        constraints = self._get_index("domain_range")[mixin]
+        ids = self.element_table.ids
+        element_ids = {}
+
+        def element_id(value):
+            if value not in element_ids:
+                element_ids[value] = ids.get(self._resolve_name(value))
+            return element_ids[value]
+
+        triples = dict.fromkeys(zip(subjects, predicates, objects))
+        for triple in triples:
+            subject, predicate, object_ = triple
+            constraint = constraints.get(element_id(predicate))
+            if constraint is None:
+                status = UNKNOWN_PREDICATE
+            elif constraint[0] is not None and element_id(subject) not in constraint[0]:
+                status = DOMAIN_VIOLATION
+            elif constraint[1] is not None and element_id(object_) not in constraint[1]:
+                status = RANGE_VIOLATION
+            else:
+                status = TRIPLE_OK
+            triples[triple] = status
+        statuses = map(triples.__getitem__, zip(subjects, predicates, objects))
+        if numpy is None:
+            return list(statuses)
+        return numpy.fromiter(statuses, dtype=numpy.int8, count=len(subjects))
+
+    def _build_domain_range_index(self) -> Dict[bool, Dict[int, tuple]]:
+        """
+        Build the domain/range compatibility of every predicate, with and without mixins.
+
+        Returns
+        -------
+        Dict[bool, Dict[int, tuple]]
+            For each predicate id, the ids of the classes that satisfy its
+            domain and of the ones that satisfy its range, or None where the
+            predicate and its ancestors have no domain or range, keyed by mixin
+
+        """
+        closure = self._get_index("closure")
+        memberships = self._get_index("memberships")
+        classes = [closure["ids"][name] for name in self.view.all_classes()]
+
+        def inherited(predicate, slot_property):
+            for ancestor in self.view.slot_ancestors(predicate):
+                value = getattr(self.view.get_slot(ancestor), slot_property)
+                if value:
+                    return value
+            return None
+
+        def satisfying(class_name, mixin):
+            class_id = closure["ids"].get(class_name)
+            if class_id is None:
+                return None
+            return frozenset(c for c in classes if self._is_subclass_of_id(c, class_id, mixin))
+
+        index = {}
+        names = closure["names"]
+        for mixin in (True, False):
+            index[mixin] = {
+                predicate_id: (
+                    satisfying(inherited(names[predicate_id], "domain"), mixin),
+                    satisfying(inherited(names[predicate_id], "range"), mixin),
+                )
+                for predicate_id in memberships[("predicate", mixin)]
+            }
+        return index
+
+    def _build_membership_index(self) -> Dict[tuple, frozenset]:
+        """
+        Build the sets of ids of the categories, predicates and qualifiers,
+        with and without mixins, as tested by ``is_category``, ``is_predicate``
+        and ``is_qualifier``.
+
+        Returns
+        -------
+        Dict[tuple, frozenset]
+            The element ids keyed by ``(kind, mixin)``
+
+        """
+        ids = self._get_index("closure")["ids"]
+
+        def members(parent, mixin):
+            parent_id = ids.get(parent)
+            if parent_id is None:
+                return frozenset()
+            return frozenset(i for i in ids.values() if self._is_subclass_of_id(i, parent_id, mixin))
+
+        slots = self.view.all_slots()
+        names = self.element_table.names
+        index = {}
+        for mixin in (True, False):
+            index[("category", mixin)] = members("named thing", mixin)
+            index[("predicate", mixin)] = members(RELATED_TO, mixin)
+        index[("qualifier", True)] = frozenset(i for i in members("qualifier", True) if names[i] in slots)
+        return index
+
+    @cached(CACHE_SIZE, names=("name",))
     def is_enum(self, name: str) -> bool:
         """
         Predicate to test (by name) if a given Biolink Model element is an Enum.
@@ -1260,7 +2712,7 @@ class Toolkit(object):
             return False
         return True
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("enum_name",))
     def is_reachable_from_enum(self, enum_name: str, value) -> bool:
         """
         method to test (by name) if a candidate
@@ -1281,15 +2733,19 @@ class Toolkit(object):
         if self.is_enum(enum_name):
             enum = self.view.get_enum(enum_name)
             if enum.reachable_from is not None and enum.reachable_from.source_ontology:
-                if value in self.oi.descendants(enum.reachable_from.source_nodes,
-                                                enum.reachable_from.relationship_types):
-                    return True
-                else:
-                    return False
+                if self._reachable_from is not None and enum.name in self._reachable_from:
+                    return value in self._reachable_from[enum.name]
+                query = enum.reachable_from
+                return self.reachability_cache.contains(
+                    query.source_nodes,
+                    query.relationship_types,
+                    value,
+                    lambda: self._get_descendant_terms(query, self.oi),
+                )
         else:
             return False
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, names=("enum_name",))
     def is_permissible_value_of_enum(self, enum_name: str, value) -> bool:
         """
         method to test (by name) if a candidate
@@ -1319,19 +2775,24 @@ class Toolkit(object):
         else:
             return False
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE)
     def get_element_by_prefix(
             self,
-            identifier: str
+            identifier: str,
+            preferred: bool = False
     ) -> List[str]:
         """
         Get a Biolink Model element by prefix.
         This method return the common ancestor of the set of elements referenced by uriorcurie.
 
+        Prefixes are matched case-insensitively.
+
         Parameters
         ----------
         identifier: str
             The identifier as a CURIE
+        preferred: bool
+            Whether to only return the elements that list the prefix first in their id_prefixes
 
         Returns
         -------
@@ -1341,20 +2802,111 @@ class Toolkit(object):
 
         """
         categories = []
-        if ":" in identifier:
-            id_components = identifier.split(":")
-            prefix = id_components[0]
-            elements = self.get_all_elements()
-            for category in elements:
-                element = self.get_element(category)
-                if hasattr(element, 'id_prefixes') and prefix in element.id_prefixes:
-                    categories.append(element.name)
+        parts = CurieCodec.split(identifier)
+        if parts is not None:
+            entries = self._get_index("id_prefixes").get(parts[0].lower(), ())
+            categories = [name for name, position in entries if position == 0 or not preferred]
         if len(categories) == 0:
             logger.warning("no biolink class found for the given curie: %s, try get_element_by_mapping?", identifier)
 
         return categories
 
-    @lru_cache(CACHE_SIZE)
+    def categories_for_curies(
+            self,
+            curies: Iterable[str],
+            most_specific: bool = True,
+            mappings: bool = False,
+            formatted: bool = False,
+    ) -> List[List[str]]:
+        """
+        Get the categories of a column of CURIEs from their prefixes, as
+        ``get_element_by_prefix`` does for one CURIE, keeping only the
+        categories among the elements found.
+
+        The categories of each distinct prefix are found once, and rows with
+        the same categories share one list. Instead of a warning for every
+        CURIE without a category, one warning counts them all.
+
+        Parameters
+        ----------
+        curies: Iterable[str]
+            The CURIEs, as a list, an iterator or a NumPy or Arrow array
+        most_specific: bool
+            Whether to leave out the categories that are ancestors of other categories of the same CURIE
+        mappings: bool
+            Whether to look for the categories of the CURIEs that have none by
+            their prefix in the most specific mappings of the elements
+        formatted: bool
+            Whether to format element names as CURIEs
+
+        Returns
+        -------
+        List[List[str]]
+            The categories of each CURIE, in model order, or an empty list
+
+        """
+        curies = to_list(curies)
+        id_prefixes = self._get_index("id_prefixes")
+        categories = self._get_index("memberships")[("category", True)]
+        table = self.element_table
+        element_curies = self._get_index("curie_table")["curies"]
+
+        def category_names(names):
+            category_ids = [table.ids[name] for name in names if table.ids.get(name) in categories]
+            if most_specific:
+                category_ids = [
+                    category_id for category_id in category_ids
+                    if not any(other != category_id and self._is_subclass_of_id(other, category_id)
+                               for other in category_ids)
+                ]
+            names = [table.names[category_id] for category_id in category_ids]
+            return [element_curies[name] for name in names] if formatted else names
+
+        by_prefix = {}
+        distinct = dict.fromkeys(curies)
+        for curie in distinct:
+            found = []
+            if isinstance(curie, str):
+                prefix, separator, _ = curie.partition(":")
+                if separator:
+                    found = by_prefix.get(prefix)
+                    if found is None:
+                        entries = id_prefixes.get(prefix.lower(), ())
+                        found = by_prefix[prefix] = category_names(name for name, _ in entries)
+                if not found and mappings:
+                    ranked = self._get_mappings(curie)
+                    found = category_names(element for rank, _, element, _ in ranked if rank == ranked[0][0])
+            distinct[curie] = found
+        missing = [curie for curie, found in distinct.items() if not found]
+        if missing:
+            count = sum(1 for found in map(distinct.__getitem__, curies) if not found)
+            logger.warning(
+                "no biolink class found for %d of %d curies (%d distinct), for instance: %s",
+                count, len(curies), len(missing), ", ".join(map(str, missing[:5])),
+            )
+        return list(map(distinct.__getitem__, curies))
+
+    def _build_id_prefix_index(self) -> Dict[str, List[tuple]]:
+        """
+        Build an index from lowercase id_prefixes to the elements that list them.
+
+        Returns
+        -------
+        Dict[str, List[tuple]]
+            For each prefix, the names of the elements in model order, each with
+            the position of the prefix in the element's id_prefixes
+
+        """
+        index = {}
+        for name in self.get_all_elements():
+            element = self.view.get_element(name)
+            for position, prefix in enumerate(getattr(element, "id_prefixes", None) or []):
+                entries = index.setdefault(prefix.lower(), [])
+                if name not in (entry[0] for entry in entries):
+                    entries.append((name, position))
+        return index
+
+    @cached(CACHE_SIZE, formatted="formatted")
     def get_element_by_mapping(
             self,
             identifier: str,
@@ -1392,7 +2944,7 @@ class Toolkit(object):
             ancestors: List[List[str]] = []
             for m in mappings:
                 ancestors.append(
-                    [x for x in self.get_ancestors(m, mixin)[::-1] if x in mappings]
+                    [x for x in self.get_ancestors(m, mixin=mixin)[::-1] if x in mappings]
                 )
                 logger.debug(ancestors)
             without_empty_lists = list(filter(None, ancestors))
@@ -1411,7 +2963,7 @@ class Toolkit(object):
                         element = a
                     return element
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE)
     def _get_element_by_mapping(self, identifier: str) -> List[str]:
         """
         Get the most specific mapping corresponding to a given identifier.
@@ -1431,27 +2983,89 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mappings = self.view.get_mappings().get(
-            self.view.namespaces.uri_for(identifier), set()
-        )
-        if not mappings:
-            exact = set(self.get_element_by_exact_mapping(identifier))
-            mappings.update(exact)
-        if not mappings:
-            close = set(self.get_element_by_close_mapping(identifier))
-            mappings.update(close)
-        if not mappings:
-            related = set(self.get_element_by_related_mapping(identifier))
-            mappings.update(related)
-        if not mappings:
-            narrow = set(self.get_element_by_narrow_mapping(identifier))
-            mappings.update(narrow)
-        if not mappings:
-            broad = set(self.get_element_by_broad_mapping(identifier))
-            mappings.update(broad)
+        mappings = self._get_mappings(identifier)
+        return [element for rank, _, element, _ in mappings if rank == mappings[0][0]]
+
+    def get_element_mappings(self, identifier: str, formatted: bool = False) -> List[tuple]:
+        """
+        Given an identifier as IRI/CURIE, find all the Biolink elements that
+        correspond to the given identifier as part of their mappings, along
+        with the kind of mapping.
+
+        The mappings are ranked from the most specific kind to the least specific:
+        ``undefined`` (the ``mappings`` of an element), ``exact``, ``close``,
+        ``related``, ``narrow`` and ``broad``.
+
+        Parameters
+        ----------
+        identifier: str
+            The identifier as an IRI or CURIE
+        formatted: bool
+            Whether to format element names as CURIEs
+
+        Returns
+        -------
+        List[tuple]
+            A list of Biolink elements and their kinds of mapping
+
+        """
+        mappings = self._get_mappings(identifier)
+        elements = self._format_all_elements([element for _, _, element, _ in mappings], formatted)
+        return [(element, kind) for element, (_, _, _, kind) in zip(elements, mappings)]
+
+    def _get_mappings(self, identifier: str, kinds: Optional[tuple] = None) -> List[tuple]:
+        mappings = self._get_index("mappings").get(self.curie_codec.expand(identifier), [])
+        if kinds is not None:
+            mappings = sorted((m for m in mappings if m[3] in kinds), key=lambda m: m[1])
         return mappings
 
-    @lru_cache(CACHE_SIZE)
+    def _build_curie_codec(self) -> CurieCodec:
+        """
+        Build the CURIE codec from the prefixes declared in the model, followed
+        by the default prefixes that SchemaView knows about.
+
+        Returns
+        -------
+        CurieCodec
+            The CURIE codec
+
+        """
+        prefixes = {}
+        for schema in self.view.schema_map.values():
+            for prefix in schema.prefixes.values():
+                prefixes.setdefault(prefix.prefix_prefix, prefix.prefix_reference)
+        for prefix, namespace in self.view.namespaces().items():
+            prefixes.setdefault(prefix, str(namespace))
+        return CurieCodec(prefixes)
+
+    def _build_mapping_index(self) -> Dict[str, List[tuple]]:
+        """
+        Build an index from the expanded IRI of every mapping of the model to
+        the elements that have it as a mapping.
+
+        Returns
+        -------
+        Dict[str, List[tuple]]
+            For each IRI, tuples of the rank of the kind of mapping, the position
+            of the element in the model, the name of the element and the kind of
+            mapping, ranked from the most specific mapping to the least specific
+
+        """
+        index = {}
+        expand = self.curie_codec.expand
+        kinds = [("undefined", "mappings")] + [(kind, f"{kind}_mappings") for kind in MAPPING_KINDS]
+        for position, name in enumerate(self.view.all_elements()):
+            element = self.view.get_element(name)
+            for rank, (kind, attribute) in enumerate(kinds):
+                for mapping in getattr(element, attribute, None) or []:
+                    entries = index.setdefault(expand(mapping), [])
+                    if (rank, position, name, kind) not in entries:
+                        entries.append((rank, position, name, kind))
+        for entries in index.values():
+            entries.sort()
+        return index
+
+    @cached(CACHE_SIZE, formatted="formatted")
     def get_element_by_exact_mapping(
             self, identifier: str, formatted: bool = False
     ) -> List[str]:
@@ -1472,13 +3086,10 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mappings = self.view.exact_mappings.get(
-            self.view.namespaces.uri_for(identifier), set()
-        )
-        logger.debug(mappings)
+        mappings = [element for _, _, element, _ in self._get_mappings(identifier, ("exact",))]
         return self._format_all_elements(mappings, formatted)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, formatted="formatted")
     def get_element_by_close_mapping(
             self, identifier: str, formatted: bool = False
     ) -> List[str]:
@@ -1488,7 +3099,7 @@ class Toolkit(object):
 
         Parameters
         ----------
-        identifier:
+        identifier: str
             The identifier as an IRI or CURIE
         formatted: bool
             Whether to format element names as CURIEs
@@ -1499,12 +3110,10 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mappings = self.view.close_mappings.get(
-            self.view.namespaces.uri_for(identifier), set()
-        )
+        mappings = [element for _, _, element, _ in self._get_mappings(identifier, ("close",))]
         return self._format_all_elements(mappings, formatted)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, formatted="formatted")
     def get_element_by_related_mapping(
             self, identifier: str, formatted: bool = False
     ) -> List[str]:
@@ -1525,12 +3134,10 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mappings = self.view.related_mappings.get(
-            self.view.namespaces.uri_for(identifier), set()
-        )
+        mappings = [element for _, _, element, _ in self._get_mappings(identifier, ("related",))]
         return self._format_all_elements(mappings, formatted)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, formatted="formatted")
     def get_element_by_narrow_mapping(
             self, identifier: str, formatted: bool = False
     ) -> List[str]:
@@ -1551,12 +3158,10 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mappings = self.view.narrow_mappings.get(
-            self.view.namespaces.uri_for(identifier), set()
-        )
+        mappings = [element for _, _, element, _ in self._get_mappings(identifier, ("narrow",))]
         return self._format_all_elements(mappings, formatted)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, formatted="formatted")
     def get_element_by_broad_mapping(
             self, identifier: str, formatted: bool = False
     ) -> List[str]:
@@ -1577,12 +3182,10 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mappings = self.view.broad_mappings.get(
-            self.view.namespaces.uri_for(identifier), set()
-        )
+        mappings = [element for _, _, element, _ in self._get_mappings(identifier, ("broad",))]
         return self._format_all_elements(mappings, formatted)
 
-    @lru_cache(CACHE_SIZE)
+    @cached(CACHE_SIZE, formatted="formatted")
     def get_all_elements_by_mapping(
             self, identifier: str, formatted: bool = False
     ) -> List[str]:
@@ -1603,7 +3206,8 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mappings = self.view.get_element_by_mapping(identifier)
+        mappings = self._get_mappings(identifier, ("exact", "close", "narrow", "broad"))
+        mappings = list(dict.fromkeys(element for _, _, element, _ in mappings))
         return self._format_all_elements(mappings, formatted)
 
     def _format_all_elements(
@@ -1626,14 +3230,113 @@ class Toolkit(object):
 
         """
         if formatted:
-            formatted_elements = [
-                format_element(self.view.get_element(x)) for x in elements
-            ]
+            formatted_elements = self._format_result(elements)
         else:
             formatted_elements = elements
         return formatted_elements
 
-    @lru_cache(CACHE_SIZE)
+    def _format_result(self, result: Union[None, str, List[str]]) -> Union[None, str, List[str]]:
+        """
+        Format the element names returned by a method as CURIEs.
+
+        Parameters
+        ----------
+        result: Union[None, str, List[str]]
+            An element name, a list of element names, or None
+
+        Returns
+        -------
+        Union[None, str, List[str]]
+            The formatted element name or list of element names, or None
+
+        """
+        if result is None:
+            return None
+        formatted_names = self._get_index("curie_table")["curies"]
+        if isinstance(result, str):
+            formatted = formatted_names.get(result)
+            return formatted if formatted is not None else format_element(self.view.get_element(result))
+        return [
+            formatted_names[x] if x in formatted_names else format_element(self.view.get_element(x))
+            for x in result
+        ]
+
+    def format_names(self, names: Iterable[Union[str, int]]) -> List[Optional[str]]:
+        """
+        Format element names as CURIEs, for a whole column at once.
+
+        Parameters
+        ----------
+        names: Iterable[Union[str, int]]
+            The names, aliases or ids of elements in the Biolink Model,
+            as a list, an iterator or a NumPy or Arrow array
+
+        Returns
+        -------
+        List[Optional[str]]
+            The CURIE of each element, or None for names that don't resolve to an element
+
+        """
+        curies = self._get_index("curie_table")["curies"]
+        formatted = {}
+        result = []
+        for name in to_list(names):
+            curie = curies.get(name)
+            if curie is None:
+                curie = formatted.get(name, _UNRESOLVED)
+                if curie is _UNRESOLVED:
+                    curie = formatted[name] = curies.get(self._resolve_name(name))
+            result.append(curie)
+        return result
+
+    def parse_curies(self, curies: Iterable[str]) -> List[Optional[str]]:
+        """
+        Get the names of elements from their CURIEs, for a whole column at once.
+
+        CURIEs are matched exactly first, and then as any other spelling of an element name.
+
+        Parameters
+        ----------
+        curies: Iterable[str]
+            The CURIEs of elements in the Biolink Model, like ``biolink:Gene``,
+            as a list, an iterator or a NumPy or Arrow array
+
+        Returns
+        -------
+        List[Optional[str]]
+            The name of each element, or None for CURIEs that don't resolve to an element
+
+        """
+        names = self._get_index("curie_table")["names"]
+        parsed = {}
+        result = []
+        for curie in to_list(curies):
+            name = names.get(curie)
+            if name is None:
+                name = parsed.get(curie, _UNRESOLVED)
+                if name is _UNRESOLVED:
+                    name = parsed[curie] = self._resolve_name(curie)
+            result.append(name)
+        return result
+
+    def _build_curie_table(self) -> Dict[str, Dict[str, str]]:
+        """
+        Build the table from the name of every element to its CURIE and back.
+
+        Returns
+        -------
+        Dict[str, Dict[str, str]]
+            CURIEs keyed by element name under ``curies``, and
+            element names keyed by CURIE under ``names``
+
+        """
+        table = self._get_index("elements")
+        names = {}
+        for name, curie in zip(table.names, table.curies):
+            names.setdefault(curie, name)
+        return {"curies": dict(zip(table.names, table.curies)), "names": names}
+
+    @cached(None)
     def get_model_version(self) -> str:
         """
         Return the version of the biolink-model in use.
@@ -1,4 +1,5 @@
 import re
+from typing import Iterable
 
 import stringcase
 from linkml_runtime.linkml_model.meta import (
@@ -154,3 +155,28 @@ def parse_name(name) -> str:
     else:
         actual_name = camelcase_to_sentencecase(name)
     return actual_name
+
+
+def to_list(values: Iterable) -> list:
+    """
+    Get the values of a list, an iterator, a NumPy array or a pandas series
+    (through ``tolist``) or an Arrow array (through ``to_pylist``) as a list.
+
+    Parameters
+    ----------
+    values: Iterable
+        The values
+
+    Returns
+    -------
+    list
+        The values as Python objects
+
+    """
+    if isinstance(values, list):
+        return values
+    if hasattr(values, "to_pylist"):
+        return values.to_pylist()
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    return list(values)
@@ -0,0 +1,136 @@
+import pytest
+
+from bmt.cache import CacheSpec, MethodCache, NegativeCache, cached
+
+
+def test_negative_cache():
+    cache = NegativeCache(2)
+    assert "a" not in cache
+    cache.add("a")
+    cache.add("b")
+    assert "a" in cache
+    # "b" is now the least recently seen key
+    cache.add("c")
+    assert "b" not in cache
+    assert "a" in cache
+    assert "c" in cache
+
+    info = cache.info()
+    assert info.hits == 3
+    assert info.misses == 2
+    assert info.evictions == 1
+    assert info.maxsize == 2
+    assert info.currsize == 2
+
+    cache.clear()
+    assert cache.info().currsize == 0
+
+
+def test_negative_cache_disabled():
+    cache = NegativeCache(0)
+    cache.add("a")
+    assert "a" not in cache
+    assert cache.info().currsize == 0
+
+
+def test_method_cache_lru():
+    cache = MethodCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    # "b" is now the least recently used key
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (2, 1, 1, 2)
+
+
+def test_method_cache_fifo():
+    cache = MethodCache(2, "fifo")
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_method_cache_sizes():
+    unbounded = MethodCache(None)
+    for i in range(5000):
+        unbounded.put(i, i)
+    assert unbounded.info().currsize == 5000
+    assert unbounded.info().evictions == 0
+
+    disabled = MethodCache(0)
+    disabled.put("a", 1)
+    assert disabled.get("a") is None
+
+    with pytest.raises(ValueError):
+        MethodCache(10, "random")
+
+
+def test_method_cache_items():
+    cache = MethodCache(2, "fifo")
+    cache.update([("a", 1), ("b", 2), ("c", 3)])
+    assert cache.items() == [("b", 2), ("c", 3)]
+    assert (cache.info().hits, cache.info().misses) == (0, 0)
+
+
+def test_cached():
+    class Model:
+        def __init__(self, config):
+            self.config = config
+            self.calls = 0
+            self.caches = {}
+
+        def _method_cache(self, name, default):
+            if name not in self.caches:
+                spec = self.config.get(name, default)
+                self.caches[name] = MethodCache(spec.maxsize, spec.policy)
+            return self.caches[name]
+
+        @cached(8)
+        def names(self, prefix, upper=False):
+            self.calls += 1
+            return [prefix.upper() if upper else prefix]
+
+    model = Model({})
+    names = model.names("a")
+    names.append("b")
+    assert model.names("a") == ["a"]
+    assert model.names("a", upper=True) == ["A"]
+    assert model.calls == 2
+    # keyword, positional and default arguments share one result
+    assert model.names("a", False) == ["a"]
+    assert model.names(prefix="a", upper=False) == ["a"]
+    assert model.names("a", True) == ["A"]
+    assert model.calls == 2
+    with pytest.raises(TypeError):
+        model.names("a", lower=True)
+    assert model.caches["names"].maxsize == 8
+
+    class Spellings(Model):
+        def _canonical_name(self, name):
+            return name.lower() if name.lower() in ("a", "b") else None
+
+        def _format_result(self, result):
+            return [f"x:{name}" for name in result]
+
+        @cached(8, names=("prefix",), formatted="formatted")
+        def names(self, prefix, formatted=False):
+            self.calls += 1
+            return [prefix]
+
+    spellings = Spellings({})
+    assert spellings.names("A") == ["a"]
+    assert spellings.names("a", formatted=True) == ["x:a"]
+    assert spellings.names("c") == ["c"]
+    assert spellings.calls == 2
+    assert spellings.caches["names"].items() == [(("a", False), ("a",)), (("c", False), ("c",))]
+
+    other = Model({"names": CacheSpec(None, "lru")})
+    assert other.names("a") == ["a"]
+    assert other.calls == 1
+    assert other.caches["names"].maxsize is None
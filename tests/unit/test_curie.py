@@ -0,0 +1,37 @@
+from bmt.curie import CurieCodec
+
+PREFIXES = {
+    "OBO": "http://purl.obolibrary.org/obo/",
+    "GO": "http://purl.obolibrary.org/obo/GO_",
+    "go": "http://purl.obolibrary.org/obo/GO_",
+    "biolink": "https://w3id.org/biolink/vocab/",
+}
+
+
+def test_expand():
+    codec = CurieCodec(PREFIXES)
+    assert codec.expand("GO:0008150") == "http://purl.obolibrary.org/obo/GO_0008150"
+    assert codec.expand("biolink:Gene") == "https://w3id.org/biolink/vocab/Gene"
+    assert codec.expand("TEST:0000001") == "TEST:0000001"
+    assert codec.expand("not a curie") == "not a curie"
+    assert codec.expand_many(["GO:0008150", "TEST:0000001"]) == [
+        "http://purl.obolibrary.org/obo/GO_0008150",
+        "TEST:0000001",
+    ]
+
+
+def test_contract():
+    codec = CurieCodec(PREFIXES)
+    # the longest namespace wins, and the first prefix among those that share it
+    assert codec.contract("http://purl.obolibrary.org/obo/GO_0008150") == "GO:0008150"
+    assert codec.contract("http://purl.obolibrary.org/obo/UBERON_0001981") == "OBO:UBERON_0001981"
+    assert codec.contract("http://example.org/thing") == "http://example.org/thing"
+    assert codec.contract_many(["https://w3id.org/biolink/vocab/Gene", "http://example.org/thing"]) == [
+        "biolink:Gene",
+        "http://example.org/thing",
+    ]
+
+
+def test_split():
+    assert CurieCodec.split("GO:0008150") == ("GO", "0008150")
+    assert CurieCodec.split("GO") is None
@@ -0,0 +1,27 @@
+from bmt.elements import ABSTRACT, MIXIN, SYMMETRIC, ElementTable
+
+
+def test_element_table():
+    table = ElementTable([
+        ("named thing", "biolink:NamedThing", "class", 0, None),
+        ("gene", "biolink:Gene", "class", 0, "named thing"),
+        ("thing with taxon", "biolink:ThingWithTaxon", "class", MIXIN | ABSTRACT, None),
+        ("related to", "biolink:related_to", "slot", SYMMETRIC, None),
+        ("gene", "biolink:Gene", "slot", 0, None),
+        ("string", "metatype:String", "type", 0, "not an element"),
+    ])
+    assert len(table) == 5
+    assert table.ids["gene"] == 1
+    assert table.kind(1) == "class"
+    assert table.parent(1) == 0
+    assert table.parent(0) is None
+    assert table.parent(4) is None
+    assert table.has_flag(2, "mixin")
+    assert table.has_flag(2, "abstract")
+    assert not table.has_flag(3, "mixin")
+    assert table.select("class") == [0, 1, 2]
+    assert table.select(flag="symmetric") == [3]
+    assert table.select("class", "mixin") == [2]
+    assert 4 in table
+    assert 5 not in table
+    assert "gene" not in table
@@ -0,0 +1,94 @@
+import os
+
+import pytest
+import requests
+
+from bmt import http_cache
+from bmt.http_cache import FILE_MODE, OfflineError, cached_path, fetch, is_pinned
+
+PINNED_URL = "https://raw.githubusercontent.com/biolink/biolink-model/v3.2.1/predicate_mapping.yaml"
+MOVING_URL = "https://raw.githubusercontent.com/biolink/biolink-model/master/predicate_mapping.yaml"
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """
+    Replaces the shared session with a fake server that records the requests made to it.
+    """
+    calls = []
+    responses = []
+
+    class FakeSession:
+        def get(self, url, headers=None, timeout=None):
+            calls.append(headers or {})
+            return responses.pop(0)
+
+    monkeypatch.setattr(http_cache, "get_session", FakeSession)
+    return calls, responses
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        (PINNED_URL, True),
+        (MOVING_URL, False),
+        ("https://raw.githubusercontent.com/biolink/biolink-model/" + "a" * 40 + "/biolink-model.yaml", True),
+        ("https://raw.githubusercontent.com/biolink/biolink-model/refs/tags/v4.2.0/biolink-model.yaml", True),
+        # branches and version-like segments of other URLs can move
+        ("https://raw.githubusercontent.com/biolink/biolink-model/v4.2/biolink-model.yaml", False),
+        ("https://example.org/api/2.0/latest.yaml", False),
+        ("https://example.org/biolink-model/v3.2.1/biolink-model.yaml", False),
+    ],
+)
+def test_is_pinned(query):
+    assert is_pinned(query[0]) is query[1]
+
+
+def test_pinned_url_is_served_from_disk(server, tmp_path):
+    calls, responses = server
+    responses.append(FakeResponse(200, b"v1"))
+    assert fetch(PINNED_URL, cache_dir=tmp_path) == b"v1"
+    assert fetch(PINNED_URL, cache_dir=tmp_path) == b"v1"
+    assert len(calls) == 1
+
+
+def test_moving_url_is_revalidated(server, tmp_path):
+    calls, responses = server
+    responses.append(FakeResponse(200, b"v1", {"ETag": '"abc"', "Last-Modified": "Wed, 01 Feb 2023 00:00:00 GMT"}))
+    responses.append(FakeResponse(304))
+    responses.append(FakeResponse(200, b"v2"))
+    assert fetch(MOVING_URL, cache_dir=tmp_path) == b"v1"
+    assert fetch(MOVING_URL, cache_dir=tmp_path) == b"v1"
+    assert calls[1] == {"If-None-Match": '"abc"', "If-Modified-Since": "Wed, 01 Feb 2023 00:00:00 GMT"}
+    assert fetch(MOVING_URL, cache_dir=tmp_path) == b"v2"
+
+
+def test_offline(server, tmp_path):
+    calls, responses = server
+    with pytest.raises(OfflineError):
+        cached_path(MOVING_URL, offline=True, cache_dir=tmp_path)
+    responses.append(FakeResponse(200, b"v1"))
+    fetch(MOVING_URL, cache_dir=tmp_path)
+    assert fetch(MOVING_URL, offline=True, cache_dir=tmp_path) == b"v1"
+    assert len(calls) == 1
+
+
+def test_cached_files_are_readable_by_others(server, tmp_path):
+    calls, responses = server
+    responses.append(FakeResponse(200, b"v1"))
+    path = cached_path(PINNED_URL, cache_dir=tmp_path)
+    # files are created with the mode of the umask, like other files, and not only for their owner
+    assert os.stat(path).st_mode & 0o777 == FILE_MODE
+    for entry in os.listdir(tmp_path / "urls"):
+        assert os.stat(tmp_path / "urls" / entry).st_mode & 0o777 == FILE_MODE
@@ -0,0 +1,83 @@
+import threading
+
+from bmt.reachability_cache import ReachabilityCache
+
+SOURCE_NODES = ["UBERON:0001062"]
+RELATIONSHIP_TYPES = ["rdfs:subClassOf"]
+
+
+class Fetcher:
+    def __init__(self, terms):
+        self.terms = terms
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return iter(self.terms)
+
+
+def test_reachability_cache(tmp_path):
+    path = str(tmp_path / "reachability.sqlite")
+    fetch = Fetcher(["UBERON:0001062", "UBERON:0001981"])
+    cache = ReachabilityCache(path)
+    assert cache.contains(SOURCE_NODES, RELATIONSHIP_TYPES, "UBERON:0001981", fetch)
+    assert not cache.contains(SOURCE_NODES, RELATIONSHIP_TYPES, "GO:0008150", fetch)
+    assert cache.contains(SOURCE_NODES, RELATIONSHIP_TYPES, "UBERON:0001062", fetch)
+    # the whole descendant set is fetched once
+    assert fetch.calls == 1
+    info = cache.info()
+    assert info.hits == 2
+    assert info.misses == 1
+    assert info.queries == 1
+
+    # another process sees the same results
+    other = ReachabilityCache(path)
+    assert other.contains(SOURCE_NODES, RELATIONSHIP_TYPES, "UBERON:0001981", fetch)
+    assert fetch.calls == 1
+    assert other.info().hits == 1
+
+    cache.clear()
+    assert cache.info().queries == 0
+    assert cache.contains(SOURCE_NODES, RELATIONSHIP_TYPES, "UBERON:0001981", fetch)
+    assert fetch.calls == 2
+
+
+def test_reachability_cache_ttl(tmp_path):
+    fetch = Fetcher(["UBERON:0001981"])
+    cache = ReachabilityCache(str(tmp_path / "reachability.sqlite"), ttl=-1)
+    assert cache.contains(SOURCE_NODES, RELATIONSHIP_TYPES, "UBERON:0001981", fetch)
+    assert cache.contains(SOURCE_NODES, RELATIONSHIP_TYPES, "UBERON:0001981", fetch)
+    assert fetch.calls == 2
+    assert cache.info().misses == 2
+
+
+def test_reachability_cache_fetch_does_not_block_other_queries(tmp_path):
+    cache = ReachabilityCache(str(tmp_path / "reachability.sqlite"))
+    assert cache.contains(["GO:0008150"], None, "GO:0008150", Fetcher(["GO:0008150"]))
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_fetch():
+        started.set()
+        release.wait(10)
+        return ["UBERON:0001981"]
+
+    thread = threading.Thread(
+        target=cache.contains, args=(SOURCE_NODES, RELATIONSHIP_TYPES, "UBERON:0001981", slow_fetch)
+    )
+    thread.start()
+    try:
+        assert started.wait(10)
+        # a cached query is answered while another query is being fetched
+        results = []
+        lookup = threading.Thread(
+            target=lambda: results.append(cache.contains(["GO:0008150"], None, "GO:0008150", Fetcher([])))
+        )
+        lookup.start()
+        lookup.join(5)
+        assert results == [True]
+    finally:
+        release.set()
+        thread.join()
+    assert cache.contains(SOURCE_NODES, RELATIONSHIP_TYPES, "UBERON:0001981", Fetcher([]))
+    assert cache.info().misses == 2
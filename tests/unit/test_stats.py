@@ -0,0 +1,50 @@
+from bmt.stats import LatencyHistogram, Stats, to_prometheus
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    histogram.observe(2e-6)
+    histogram.observe(2e-6)
+    histogram.observe(0.2)
+    histogram.observe(100)
+    data = histogram.to_dict()
+    assert data["count"] == 4
+    assert data["buckets"]["1e-06"] == 0
+    assert data["buckets"]["5e-06"] == 2
+    assert data["buckets"]["0.5"] == 3
+    assert data["buckets"]["10.0"] == 3
+    assert data["buckets"]["+Inf"] == 4
+
+
+def test_stats():
+    stats = Stats()
+    stats.enabled = True
+    stats.record("method", "get_element", 1e-5)
+    stats.record("ubergraph", "descendants", 1.5)
+    data = stats.to_dict()
+    assert data["method"]["get_element"]["count"] == 1
+    assert data["ubergraph"]["descendants"]["sum"] == 1.5
+    stats.clear()
+    assert stats.to_dict() == {}
+
+
+def test_to_prometheus():
+    stats = Stats(enabled=True)
+    stats.record("method", "get_element", 1e-5)
+    stats.record("schemaview", "class_ancestors", 1e-3)
+    groups = stats.to_dict()
+    text = to_prometheus({
+        "methods": {
+            "get_element": {
+                "calls": 1, "latency": groups["method"]["get_element"],
+                "hits": 3, "misses": 1, "evictions": 0, "maxsize": 1024, "currsize": 1,
+            },
+        },
+        "schemaview": groups["schemaview"],
+    })
+    assert "# TYPE bmt_method_calls_total counter" in text
+    assert 'bmt_method_calls_total{method="get_element"} 1' in text
+    assert 'bmt_method_cache_hits_total{method="get_element"} 3' in text
+    assert 'bmt_method_latency_seconds_bucket{method="get_element",le="+Inf"} 1' in text
+    assert 'bmt_schemaview_latency_seconds_count{method="class_ancestors"} 1' in text
+    assert "bmt_ubergraph" not in text
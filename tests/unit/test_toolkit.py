@@ -1,7 +1,26 @@
+import gc
+import threading
+import weakref
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from typing import Tuple
 
 import pytest
+from linkml_runtime.linkml_model.meta import EnumDefinition, ReachabilityQuery
+
 from bmt import Toolkit
+from bmt.cache import CacheSpec
+from bmt.reachability_cache import ReachabilityCache
+from bmt.toolkit import (
+    DOMAIN_VIOLATION,
+    INVALID_QUALIFIER_VALUE,
+    QUALIFIER_OK,
+    RANGE_VIOLATION,
+    TRIPLE_OK,
+    UNCONSTRAINED_QUALIFIER,
+    UNKNOWN_PREDICATE,
+    UNKNOWN_QUALIFIER,
+)
 
 
 @pytest.fixture(scope="module")
@@ -69,6 +88,121 @@ def test_get_model_version(toolkit):
     assert version == "3.2.0"
 
 
+class SourceFile(str):
+    pass
+
+
+def test_snapshot(toolkit, tmp_path):
+    path = tmp_path / "biolink.bmt"
+    # compiling leaves the source files of the schemas, which may not be plain strings, as they were
+    source_file = toolkit.view.schema.source_file
+    vars(toolkit.view.schema)["source_file"] = SourceFile(source_file)
+    toolkit.compile(path)
+    assert type(toolkit.view.schema.source_file) is SourceFile
+    vars(toolkit.view.schema)["source_file"] = source_file
+    snapshot = Toolkit.from_snapshot(path)
+    assert type(snapshot.view.schema.source_file) is str
+    assert snapshot.get_model_version() == toolkit.get_model_version()
+    assert snapshot.get_ancestors(GENE) == toolkit.get_ancestors(GENE)
+    assert snapshot.get_predicate_mapping("augments") == toolkit.get_predicate_mapping("augments")
+    assert snapshot.get_infores_details("infores:aragorn") == toolkit.get_infores_details("infores:aragorn")
+
+    not_a_snapshot = tmp_path / "biolink.yaml"
+    not_a_snapshot.write_text("id: biolink")
+    with pytest.raises(ValueError):
+        Toolkit.from_snapshot(not_a_snapshot)
+
+
+def test_warm(tmp_path):
+    toolkit = Toolkit(cache_config={"get_element": 10})
+    info = toolkit.warm(workers=2)
+    assert info.results > len(toolkit.get_all_elements())
+    assert info.memory is None
+    assert toolkit.cache_info()["get_ancestors"].maxsize is None
+    assert toolkit.cache_info()["get_element"].maxsize == 10
+
+    path = tmp_path / "biolink.bmt"
+    toolkit.compile(path)
+    snapshot = Toolkit.from_snapshot(path)
+    assert snapshot.get_ancestors(GENE, formatted=True) == toolkit.get_ancestors(GENE, formatted=True)
+    assert snapshot.get_slot_domain(ENABLED_BY, include_ancestors=True) == toolkit.get_slot_domain(ENABLED_BY, True)
+    assert snapshot.is_category(GENE, mixin=False)
+    info = snapshot.cache_info()
+    assert info["get_ancestors"].misses == 0
+    assert info["get_slot_domain"].misses == 0
+    assert info["is_category"].misses == 0
+
+
+def test_lazy_resources():
+    toolkit = Toolkit()
+    assert toolkit._pmap is None
+    assert toolkit._infores_map is None
+    assert toolkit._oi is None
+    assert toolkit.get_predicate_mapping("augments")
+    assert toolkit._pmap is not None
+    assert toolkit._infores_map is None
+
+    toolkit = Toolkit(eager_load=True)
+    assert toolkit._pmap is not None
+    assert toolkit._infores_map is not None
+    assert toolkit._oi is not None
+    timings = toolkit.get_load_timings()
+    assert "schema parse" in timings
+    assert "predicate map fetch" in timings
+    assert "infores map parse" in timings
+    assert timings["total"] >= timings["schema parse"]
+
+
+def test_assign_lazy_resources():
+    toolkit = Toolkit()
+    assert toolkit.get_predicate_mapping("augments")
+    toolkit.pmap = {"predicate mappings": [{"mapped predicate": "custom", "predicate": "related to"}]}
+    assert toolkit.get_predicate_mapping("custom") == {
+        "biolink:mapped_predicate": "custom", "biolink:predicate": "related to"
+    }
+    assert toolkit.get_predicate_mapping("augments") == {}
+
+    assert toolkit.get_infores_details("infores:aragorn")
+    toolkit.infores_map = {"infores:custom": {"id": "infores:custom"}}
+    assert toolkit.get_infores_details("infores:custom") == {"id": "infores:custom"}
+    assert toolkit.get_infores_details("infores:aragorn") is None
+
+    adapter = LocalAdapter({})
+    toolkit.oi = adapter
+    assert toolkit.oi is adapter
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def test_remote_schema_with_relative_import(tmp_path, monkeypatch):
+    monkeypatch.setenv("BMT_CACHE_DIR", str(tmp_path / "cache"))
+    header = "prefixes:\n  linkml: https://w3id.org/linkml/\n  ex: https://example.org/\ndefault_prefix: ex\n"
+    (tmp_path / "main.yaml").write_text(
+        "id: https://example.org/main\nname: main\n" + header
+        + "imports:\n  - linkml:types\n  - ./other\nclasses:\n  main thing:\n    is_a: other thing\n"
+    )
+    (tmp_path / "other.yaml").write_text(
+        "id: https://example.org/other\nname: other\n" + header + "classes:\n  other thing: {}\n"
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=str(tmp_path)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/main.yaml"
+    try:
+        toolkit = Toolkit(url)
+        assert toolkit.get_ancestors("main thing") == ["main thing", "other thing"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # the imported schema was cached along with the one that imports it
+    monkeypatch.setenv("BMT_OFFLINE", "1")
+    toolkit = Toolkit(url)
+    assert toolkit.get_ancestors("main thing") == ["main thing", "other thing"]
+
+
 def test_get_id_prefixes(toolkit):
     tclass = toolkit.get_element('biolink:Gene')
     print(tclass.id_prefixes)
@@ -82,6 +216,16 @@ def test_get_element_via_alias(toolkit):
 def test_predicate_map(toolkit):
     mp = toolkit.get_predicate_mapping("augments")
     assert mp.get("biolink:object_aspect_qualifier") == 'activity or abundance'
+    assert toolkit.get_predicate_mapping("not a mapped predicate") == {}
+
+    qualifiers = {"object aspect qualifier": "activity or abundance", "object direction qualifier": "increased"}
+    assert toolkit.get_mapped_predicate("affects", qualifiers) == "augments"
+    qualifiers = {
+        "biolink:object_aspect_qualifier": "activity_or_abundance",
+        "biolink:object_direction_qualifier": "increased",
+    }
+    assert toolkit.get_mapped_predicate("biolink:affects", qualifiers, formatted=True) == "biolink:augments"
+    assert toolkit.get_mapped_predicate("affects", {"object direction qualifier": "increased"}) is None
 
 
 def test_infores(toolkit):
@@ -110,6 +254,32 @@ def test_get_element_by_prefix(toolkit):
     elements = toolkit.get_element_by_prefix("TEST:1234")
     assert "anatomical entity" not in elements
 
+    elements = toolkit.get_element_by_prefix("uberon:1234")
+    assert "anatomical entity" in elements
+
+    elements = toolkit.get_element_by_prefix("CHEBI:1234", preferred=True)
+    assert "small molecule" in elements
+    assert "drug" not in elements
+    assert "drug" in toolkit.get_element_by_prefix("CHEBI:1234")
+
+
+def test_categories_for_curies(toolkit, caplog):
+    curies = ["MONDO:0005148", "mondo:1", "NCBIGene:1017", "CHEBI:1234", "TEST:1234", "foo", None, "MONDO:0005148"]
+    categories = toolkit.categories_for_curies(curies, most_specific=False)
+    assert categories[0] == categories[1] == categories[7] == ["disease"]
+    assert categories[2] == ["gene", "noncoding RNA product"]
+    assert {"chemical entity", "small molecule", "drug"} <= set(categories[3])
+    assert categories[4:7] == [[], [], []]
+    assert len([record for record in caplog.records if record.name == "bmt.toolkit"]) == 1
+    assert "3 of 8 curies" in caplog.text
+
+    categories = toolkit.categories_for_curies(iter(curies), formatted=True)
+    assert "biolink:SmallMolecule" in categories[3]
+    assert "biolink:ChemicalEntity" not in categories[3]
+
+    assert toolkit.categories_for_curies(["UMLSSG:LIVB"]) == [[]]
+    assert toolkit.categories_for_curies(["UMLSSG:LIVB"], mappings=True) == [["organismal entity"]]
+
 
 def test_get_all_elements(toolkit):
     elements = toolkit.get_all_elements()
@@ -204,6 +374,211 @@ def test_get_element(toolkit):
     o = toolkit.get_element("rna product")
     assert o and o.name == "RNA product"
 
+    o = toolkit.get_element("biolink:RNAProduct")
+    assert o and o.name == "RNA product"
+
+    o = toolkit.get_element("NoncodingRNAProduct")
+    assert o and o.name == "noncoding RNA product"
+
+    o = toolkit.get_element("biolink:has_gene")
+    assert o and o.name == "has gene"
+
+    o = toolkit.get_element(DIRECTION_QUALIFIER_ENUM_CURIE)
+    assert o and o.name == DIRECTION_QUALIFIER_ENUM_NAME
+
+    assert toolkit.get_element("biolink:ThingDoesNotExist") is None
+    assert toolkit.get_element("thing_does_not_exist") is None
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        ("biolink:RNA_product", "RNA product"),
+        ("biolink:RNA_product_isoform", "RNA product isoform"),
+        ("biolink:noncoding_RNA_product", "noncoding RNA product"),
+        ("biolink:highest_FDA_approval_status", "highest FDA approval status"),
+        ("biolink:FDA_adverse_event_level", "FDA adverse event level"),
+        ("biolink:rna_product", "RNA product"),
+    ]
+)
+def test_get_element_by_acronym_curie(toolkit, query: Tuple[str, str]):
+    o = toolkit.get_element(query[0])
+    assert o and o.name == query[1]
+
+
+def test_stats():
+    toolkit = Toolkit(collect_stats=True)
+    toolkit.get_element(GENE)
+    toolkit.get_element(GENE)
+    toolkit.get_descendants(NAMED_THING)
+    stats = toolkit.stats()
+    assert stats["enabled"]
+    get_element = stats["methods"]["get_element"]
+    assert get_element["calls"] == 2
+    assert get_element["hits"] == 1
+    assert get_element["misses"] == 1
+    assert get_element["latency"]["buckets"]["+Inf"] == 2
+    assert stats["schemaview"]
+    assert "stats" not in stats["methods"]
+    assert 'bmt_method_calls_total{method="get_element"} 2' in toolkit.stats(format="prometheus")
+
+    toolkit.enable_stats(False)
+    toolkit.get_element(GENE)
+    assert toolkit.stats()["methods"]["get_element"]["calls"] == 2
+    assert toolkit.stats()["methods"]["get_element"]["hits"] == 2
+
+
+def test_negative_cache(toolkit):
+    hits = toolkit.negative_cache_info().hits
+    assert toolkit._resolve_name("biolink:NotACategory") is None
+    assert toolkit._resolve_name("biolink:NotACategory") is None
+    assert toolkit.negative_cache_info().hits == hits + 1
+    assert not toolkit.is_category("biolink:NotACategory")
+
+
+def test_method_caches():
+    toolkit = Toolkit(cache_config={"get_ancestors": 1, "get_descendants": CacheSpec(None, "fifo")})
+    ancestors = toolkit.get_ancestors(GENE)
+    ancestors.append("not an ancestor")
+    assert "not an ancestor" not in toolkit.get_ancestors(GENE)
+    toolkit.get_ancestors(CAUSES)
+    info = toolkit.cache_info()["get_ancestors"]
+    assert (info.hits, info.misses, info.evictions, info.maxsize) == (1, 2, 1, 1)
+
+    toolkit.get_descendants(NAMED_THING)
+    assert toolkit.cache_info()["get_descendants"].policy == "fifo"
+    assert toolkit.cache_info()["get_descendants"].maxsize is None
+    toolkit.get_all_classes()
+    assert toolkit.cache_info()["get_all_classes"].maxsize is None
+
+    toolkit.configure_cache("get_ancestors", 0)
+    toolkit.get_ancestors(GENE)
+    assert toolkit.cache_info()["get_ancestors"].currsize == 0
+    with pytest.raises(ValueError):
+        toolkit.configure_cache("compile", 10)
+
+    toolkit.clear_caches()
+    assert toolkit.cache_info()["get_descendants"].currsize == 0
+
+    # caches belong to the instance, so the instance can be collected
+    reference = weakref.ref(toolkit)
+    del toolkit
+    gc.collect()
+    assert reference() is None
+
+
+def test_name_normalized_cache_keys():
+    toolkit = Toolkit()
+    ancestors = toolkit.get_ancestors(GENE)
+    assert toolkit.get_ancestors("Gene") == ancestors
+    assert toolkit.get_ancestors("biolink:Gene", reflexive=True) == ancestors
+    assert toolkit.get_ancestors("biolink:Gene", formatted=True) == toolkit._format_all_elements(ancestors, True)
+    info = toolkit.cache_info()["get_ancestors"]
+    assert (info.hits, info.misses, info.currsize) == (3, 1, 1)
+    assert toolkit.get_ancestors("not a class") == []
+
+
+def test_element_ids(toolkit):
+    gene = toolkit.get_element_id("biolink:Gene")
+    assert toolkit.get_element_id(GENE) == gene
+    assert toolkit.get_element_id(gene) == gene
+    assert toolkit.get_element_id("not an element") is None
+    assert toolkit.get_element_name(gene) == GENE
+    assert toolkit.get_element_name(gene, formatted=True) == "biolink:Gene"
+    assert toolkit.get_element_name(len(toolkit.element_table)) is None
+
+    # only ints in range are ids
+    for value in (True, False, 1.0, -1, len(toolkit.element_table)):
+        assert toolkit.get_element_id(value) is None
+        assert toolkit.get_element(value) is None
+
+    table = toolkit.element_table
+    assert table.kind(gene) == "class"
+    assert toolkit.get_element_name(table.parent(gene)) == toolkit.get_parent(GENE)
+    assert table.has_flag(toolkit.get_element_id(THING_WITH_TAXON), "mixin")
+    assert table.has_flag(toolkit.get_element_id(RELATED_TO), "canonical")
+    assert table.kind(toolkit.get_element_id(DIRECTION_QUALIFIER_ENUM_NAME)) == "enum"
+
+    # methods take ids as well as names
+    assert toolkit.get_ancestors(gene) == toolkit.get_ancestors(GENE)
+    assert toolkit.is_category(gene)
+    assert toolkit.get_element(gene).name == GENE
+    ancestor_ids = toolkit.get_ancestor_ids(GENE, reflexive=False)
+    assert [toolkit.get_element_name(i) for i in ancestor_ids] == toolkit.get_ancestors(GENE, reflexive=False)
+    descendant_ids = toolkit.get_descendant_ids(gene, mixin=False)
+    assert [toolkit.get_element_name(i) for i in descendant_ids] == toolkit.get_descendants(GENE, mixin=False)
+
+
+def test_format_names_and_parse_curies(toolkit):
+    gene = toolkit.get_element_id(GENE)
+    assert toolkit.format_names([GENE, "Gene", gene, RELATED_TO, "not an element", GENE]) == [
+        "biolink:Gene", "biolink:Gene", "biolink:Gene", BIOLINK_RELATED_TO, None, "biolink:Gene"
+    ]
+    assert toolkit.parse_curies(iter(["biolink:Gene", BIOLINK_RELATED_TO, "biolink:gene", "biolink:NotAClass"])) == [
+        GENE, RELATED_TO, GENE, None
+    ]
+    assert toolkit.format_names([]) == []
+
+
+def test_resolve_many(toolkit):
+    values = ["biolink:Gene", GENE, "not an element", None, RELATED_TO, toolkit.get_element_id(GENE)]
+    resolved = toolkit.resolve_many(iter(values))
+    assert resolved.names == [GENE, GENE, None, None, RELATED_TO, GENE]
+    assert resolved.curies == ["biolink:Gene", "biolink:Gene", None, None, BIOLINK_RELATED_TO, "biolink:Gene"]
+    assert resolved.kinds == ["class", "class", None, None, "slot", "class"]
+    assert [e and e.name for e in toolkit.get_elements(values)] == resolved.names
+
+
+def test_resolve_many_arrays(toolkit):
+    numpy = pytest.importorskip("numpy")
+    resolved = toolkit.resolve_many(numpy.array(["biolink:Gene", "biolink:NotAClass"]))
+    assert resolved.names == [GENE, None]
+
+
+def test_masks(toolkit):
+    names = [GENE, "biolink:Gene", CAUSES, ASPECT_QUALIFIER_NAME, THING_WITH_TAXON, "not an element", GENE]
+    assert list(toolkit.is_category_mask(names)) == [True, True, False, False, False, False, True]
+    assert list(toolkit.is_predicate_mask(iter(names))) == [False, False, True, False, False, False, False]
+    assert list(toolkit.is_qualifier_mask(names)) == [False, False, False, True, False, False, False]
+    for mixin in (True, False):
+        mask = toolkit.is_category_mask(names, mixin=mixin)
+        assert [bool(x) for x in mask] == [toolkit.is_category(name, mixin) for name in names]
+
+
+def test_validate_triples(toolkit):
+    triples = [
+        ("biolink:SmallMolecule", "biolink:treats", "biolink:Disease"),
+        ("biolink:Gene", "biolink:treats", "biolink:Disease"),
+        ("biolink:Gene", "biolink:has_phenotype", "biolink:Disease"),
+        ("biolink:Gene", "biolink:gene_associated_with_condition", "biolink:Disease"),
+        ("biolink:Gene", "biolink:Gene", "biolink:Disease"),
+        ("biolink:Gene", "biolink:not_a_predicate", "biolink:Disease"),
+        ("biolink:NotAClass", "biolink:interacts_with", "biolink:Gene"),
+        ("biolink:Gene", "biolink:causes", "biolink:Disease"),
+        ("biolink:SmallMolecule", "biolink:treats", "biolink:Disease"),
+    ]
+    subjects, predicates, objects = zip(*triples)
+    statuses = toolkit.validate_triples(subjects, predicates, iter(objects))
+    assert list(statuses) == [
+        TRIPLE_OK, DOMAIN_VIOLATION, RANGE_VIOLATION, TRIPLE_OK, UNKNOWN_PREDICATE, UNKNOWN_PREDICATE,
+        DOMAIN_VIOLATION, TRIPLE_OK, TRIPLE_OK,
+    ]
+    with pytest.raises(ValueError):
+        toolkit.validate_triples(subjects, predicates, objects[:1])
+
+
+def test_is_subclass_of(toolkit):
+    assert toolkit.is_subclass_of(GENE, NAMED_THING)
+    assert toolkit.is_subclass_of("biolink:Gene", BIOLINK_NAMED_THING)
+    assert toolkit.is_subclass_of(GENE, GENE)
+    assert toolkit.is_subclass_of(GENE, GENE_OR_GENE_PRODUCT)
+    assert not toolkit.is_subclass_of(GENE, GENE_OR_GENE_PRODUCT, mixin=False)
+    assert not toolkit.is_subclass_of(NAMED_THING, GENE)
+    assert toolkit.is_subclass_of(CAUSES, RELATED_TO)
+    assert not toolkit.is_subclass_of(CAUSES, GENE)
+    assert not toolkit.is_subclass_of("biolink:NotAClass", NAMED_THING)
+    assert toolkit.is_category(NAMED_THING, mixin=False)
+
 
 def test_is_node_property(toolkit):
     assert toolkit.is_node_property(NODE_PROPERTY)
@@ -288,6 +663,70 @@ def test_is_reachable_from_enum(toolkit):
     assert not toolkit.is_reachable_from_enum(ANATOMICAL_CONTEXT_QUALIFIER_ENUM_NAME, "pax:0001981")
 
 
+class LocalAdapter:
+    """
+    Stands in for an oaklib adapter over a small local ontology.
+    """
+
+    def __init__(self, parents):
+        self.parents = parents
+        self.queries = 0
+
+    def descendants(self, start_curies, predicates=None, reflexive=True):
+        self.queries += 1
+        found = set(start_curies) if reflexive else set()
+        frontier = set(start_curies)
+        while frontier:
+            frontier = {c for c, ps in self.parents.items() if ps & frontier} - found
+            found |= frontier
+        return iter(found)
+
+
+def add_anatomy_enum(toolkit):
+    toolkit.view.add_enum(
+        EnumDefinition(
+            "test anatomy enum",
+            reachable_from=ReachabilityQuery(
+                source_ontology="bioregistry:uberon",
+                source_nodes=["UBERON:0001062"],
+                relationship_types=["rdfs:subClassOf"],
+            ),
+        )
+    )
+    return LocalAdapter({"UBERON:0001981": {"UBERON:0000055"}, "UBERON:0000055": {"UBERON:0001062"}})
+
+
+def test_reachability_cache(tmp_path):
+    toolkit = Toolkit()
+    adapter = add_anatomy_enum(toolkit)
+    # stand in for Ubergraph
+    toolkit._oi = adapter
+    toolkit.reachability_cache = ReachabilityCache(str(tmp_path / "reachability.sqlite"))
+    assert toolkit.is_reachable_from_enum("test anatomy enum", "UBERON:0001981")
+    assert toolkit.is_reachable_from_enum("test anatomy enum", "UBERON:0000055")
+    assert not toolkit.is_reachable_from_enum("test anatomy enum", "GO:0008150")
+    assert adapter.queries == 1
+    info = toolkit.reachability_cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+def test_materialize_reachable_from(tmp_path):
+    toolkit = Toolkit()
+    adapter = add_anatomy_enum(toolkit)
+    assert toolkit.materialize_reachable_from(adapter) == {"test anatomy enum": 3}
+    assert toolkit.is_reachable_from_enum("test anatomy enum", "UBERON:0001981")
+    assert not toolkit.is_reachable_from_enum("test anatomy enum", "GO:0008150")
+    assert adapter.queries == 1
+    assert toolkit._oi is None
+
+    path = tmp_path / "biolink.bmt"
+    toolkit.compile(path)
+    snapshot = Toolkit.from_snapshot(path)
+    assert snapshot.is_reachable_from_enum("test anatomy enum", "UBERON:0000055")
+    assert snapshot._oi is None
+
+
 @pytest.mark.parametrize(
     "query",
     [
@@ -343,6 +782,27 @@ def test_validate_qualifier(toolkit, query: Tuple[str, str, bool]):
     assert toolkit.validate_qualifier(query[0], query[1]) is query[2]
 
 
+def test_validate_qualifiers(toolkit):
+    queries = [
+        (SUBJECT_DIRECTION_QUALIFIER_NAME, "upregulated", QUALIFIER_OK),
+        (SUBJECT_DIRECTION_QUALIFIER_CURIE, "upregulated", QUALIFIER_OK),
+        (SPECIES_CONTEXT_QUALIFIER_CURIE, "NCBITaxon:9606", QUALIFIER_OK),
+        (SUBJECT_DIRECTION_QUALIFIER_NAME, "UBERON:0001981", INVALID_QUALIFIER_VALUE),
+        (SPECIES_CONTEXT_QUALIFIER_NAME, "upregulated", INVALID_QUALIFIER_VALUE),
+        (SPECIES_CONTEXT_QUALIFIER_NAME, "", INVALID_QUALIFIER_VALUE),
+        (ASPECT_QUALIFIER_NAME, "upregulated", UNCONSTRAINED_QUALIFIER),
+        (GENE, "upregulated", UNKNOWN_QUALIFIER),
+        (SUBJECT_DIRECTION_QUALIFIER_NAME, "upregulated", QUALIFIER_OK),
+    ]
+    types, values, expected = zip(*queries)
+    statuses = toolkit.validate_qualifiers(types, iter(values), reasons=True)
+    assert list(statuses) == list(expected)
+    mask = toolkit.validate_qualifiers(types, values)
+    assert [bool(valid) for valid in mask] == [toolkit.validate_qualifier(t, v) for t, v in zip(types, values)]
+    with pytest.raises(ValueError):
+        toolkit.validate_qualifiers(types, values[:1])
+
+
 def test_is_permissible_value_of_enum(toolkit):
     assert toolkit.is_permissible_value_of_enum(ANATOMICAL_CONTEXT_QUALIFIER_ENUM_NAME, "UBERON:0001981")  # Blood Vessel
     assert toolkit.is_permissible_value_of_enum(DIRECTION_QUALIFIER_ENUM_NAME, "upregulated")
@@ -450,6 +910,25 @@ def test_mapping(toolkit):
     assert len(toolkit.get_all_elements_by_mapping("UPHENO:0000001")) == 1
     assert "affects" in toolkit.get_all_elements_by_mapping("UPHENO:0000001")
 
+    assert toolkit.get_element_mappings("SO:0000704") == [(GENE, "exact")]
+    assert toolkit.get_element_mappings("http://purl.obolibrary.org/obo/SO_0000704", formatted=True) == [
+        ("biolink:Gene", "exact")
+    ]
+    assert toolkit.get_element_by_exact_mapping("SO:0000704") == [GENE]
+    assert toolkit.get_element_by_broad_mapping("SO:0000704") == []
+    assert toolkit.get_element_by_mapping("SO:0000704", most_specific=True) == GENE
+    assert toolkit.get_element_mappings("TEST:0000001") == []
+
+
+def test_curie_codec(toolkit):
+    codec = toolkit.curie_codec
+    assert codec.expand("SO:0000704") == "http://purl.obolibrary.org/obo/SO_0000704"
+    assert codec.contract("https://w3id.org/biolink/vocab/Gene") == "biolink:Gene"
+    assert codec.contract_many(codec.expand_many(["SO:0000704", BIOLINK_NAMED_THING])) == [
+        "SO:0000704",
+        BIOLINK_NAMED_THING,
+    ]
+
 
 def test_get_slot_domain(toolkit):
     assert NAMED_THING in toolkit.get_slot_domain("ameliorates")
@@ -486,6 +965,14 @@ def test_get_all_slots_with_class_domain(toolkit):
     assert "has unit" in toolkit.get_all_slots_with_class_domain(
         "quantity value", check_ancestors=False, mixin=True
     )
+    # "in taxon label" has the mixin "thing with taxon" as its domain
+    assert "in taxon label" in toolkit.get_all_slots_with_class_domain(
+        BIOLOGICAL_ENTITY, check_ancestors=True, mixin=True
+    )
+    assert "in taxon label" not in toolkit.get_all_slots_with_class_domain(
+        BIOLOGICAL_ENTITY, check_ancestors=True, mixin=False
+    )
+    assert toolkit.get_all_slots_with_class_domain("biolink:NotAClass") == []
 
 
 def test_get_all_slots_with_class_range(toolkit):